@@ -1,3 +1,9 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
 from ..base import MbaE
 
 
@@ -99,6 +105,10 @@ class DataSet(MbaE):
         :type alias: str
 
         """
+        # prior attributes
+        self._data = None
+        self._file_lazy = None  # file data pending for lazy loading
+
         # ------------ call super ----------- #
         super().__init__(name=name, alias=alias)
         # overwriters
@@ -117,6 +127,9 @@ class DataSet(MbaE):
         # ------------ set defaults ----------- #
         self.color = "blue"
         self.file_data_sep = ";"
+        self.chunksize = 100000  # rows per chunk in streaming loads
+        self.lazy = False  # option for loading data on first access
+        self._set_data_schema()
 
         # UPDATE
         self.update()
@@ -142,6 +155,20 @@ class DataSet(MbaE):
             )
         return str_out
 
+    @property
+    def data(self):
+        """The data table. In lazy mode, it is loaded on first access.
+
+        :return: data table
+        :rtype: :class:`pandas.DataFrame`
+        """
+        self._load_lazy()
+        return self._data
+
+    @data.setter
+    def data(self, input_df):
+        self._data = input_df
+
     def _set_fields(self):
         """Set fields names.
         Expected to increment superior methods.
@@ -158,6 +185,33 @@ class DataSet(MbaE):
 
         # ... continues in downstream objects ... #
 
+    def _set_data_schema(self):
+        """Set the declarative data schema, pushed down into the file reader.
+        Expected to increment superior methods.
+
+        **Notes:**
+
+        - Only the columns in the schema are parsed from file.
+        - Row filters take a scalar for equality, a list or set for
+          membership and a ``(min, max)`` tuple for an inclusive range
+          (``None`` for an open end).
+
+        :return: None
+        :rtype: None
+        """
+        # Column dtypes (explicit, no type inference)
+        self.columns_data_dtypes = {
+            # 'DateTime': 'datetime64[1s]',
+            "P": float,
+            "RM": float,
+            "TempDB": float,
+        }
+        # Required columns (rows with missing values are dropped)
+        self.columns_data_required = ["P", "RM", "TempDB"]
+        # Row filters by column
+        self.columns_data_filters = {}
+        # ... continues in downstream objects ... #
+
     def _set_view_specs(self):
         """Set view specifications.
         Expected to overwrite superior methods.
@@ -182,6 +236,11 @@ class DataSet(MbaE):
             "xmax": None,
             "ymin": None,
             "ymax": None,
+            # large data: "scatter", "density" or "auto" (density over max_points)
+            "mode": "auto",
+            "max_points": 100000,
+            "bins": 400,
+            "cmap": "Blues",
         }
         return None
 
@@ -224,7 +283,7 @@ class DataSet(MbaE):
         # set fields
         self._set_fields()
 
-        if self.data is not None:
+        if self._file_lazy is None and self.data is not None:
             # data size (rows)
             self.size = len(self.data)
 
@@ -272,7 +331,10 @@ class DataSet(MbaE):
 
         # -------------- set data logic here -------------- #
         if load_data:
-            self.load_data(file_data=self.file_data)
+            if self.lazy:
+                self._set_lazy(file_data=self.file_data)
+            else:
+                self.load_data(file_data=self.file_data)
 
         # -------------- update other mutables -------------- #
         self.update()
@@ -292,22 +354,21 @@ class DataSet(MbaE):
         self.file_data = os.path.abspath(file_data)
 
         # -------------- implement loading logic -------------- #
-        default_columns = {
-            #'DateTime': 'datetime64[1s]',
-            "P": float,
-            "RM": float,
-            "TempDB": float,
-        }
+        dict_reader = self._get_reader_args()
+
         # -------------- call loading function -------------- #
-        self.data = pd.read_csv(
-            self.file_data,
-            sep=self.file_data_sep,
-            dtype=default_columns,
-            usecols=list(default_columns.keys()),
-        )
+        if self.columns_data_filters:
+            # filter rows by chunks, so the unfiltered table is never held
+            list_dfs = list(self.iter_data(file_data=self.file_data))
+            self.data = pd.concat(list_dfs)
+        else:
+            df = pd.read_csv(self.file_data, **dict_reader)
+            # -------------- post-loading logic -------------- #
+            self.data = self._get_filtered_data(df)
 
-        # -------------- post-loading logic -------------- #
-        self.data.dropna(inplace=True)
+        if self.lazy:
+            # cache size for the next lazy boot
+            self._write_sidecar(file_data=self.file_data, size=len(self.data))
 
         # -------------- update other mutables -------------- #
         self.update()
@@ -316,6 +377,178 @@ class DataSet(MbaE):
 
         return None
 
+    def _set_lazy(self, file_data):
+        """Set the data to be loaded from file on first access.
+        The data size is taken from cheap file metadata.
+
+        :param file_data: file path to data.
+        :type file_data: str
+        :return: None
+        :rtype: None
+        """
+        self.data = None
+        self.file_data = os.path.abspath(file_data)
+        self._file_lazy = self.file_data
+        self.size = self._get_file_size(file_data=self.file_data)
+        return None
+
+    def _load_lazy(self):
+        """Load the data pending for lazy loading, if any.
+        Expected to increment superior methods.
+
+        :return: None
+        :rtype: None
+        """
+        if self._file_lazy is not None:
+            file_data = self._file_lazy
+            self._file_lazy = None
+            self.load_data(file_data=file_data)
+        return None
+
+    def unload(self):
+        """Release the data from memory. It is loaded again from file on
+        next access.
+        Expected to increment superior methods.
+
+        :return: None
+        :rtype: None
+        """
+        if self.file_data is not None and self._file_lazy is None:
+            n_size = self.size
+            self._set_lazy(file_data=self.file_data)
+            if self.size is None:
+                self.size = n_size
+        return None
+
+    def _get_file_sidecar(self, file_data=None):
+        """Get the metadata sidecar file path, next to the data file.
+
+        :param file_data: file path to data. If None, it takes ``file_data``.
+        :type file_data: str
+        :return: file path to sidecar
+        :rtype: str
+        """
+        if file_data is None:
+            file_data = self.file_data
+        return os.path.splitext(file_data)[0] + "_meta.json"
+
+    def _write_sidecar(self, file_data, size):
+        """Write the metadata sidecar of a data file.
+
+        :param file_data: file path to data.
+        :type file_data: str
+        :param size: data size (rows)
+        :type size: int
+        :return: None
+        :rtype: None
+        """
+        dict_meta = {"Size": int(size), "Mtime": os.path.getmtime(file_data)}
+        with open(self._get_file_sidecar(file_data=file_data), "w") as f:
+            json.dump(dict_meta, f)
+        return None
+
+    def _get_file_size(self, file_data):
+        """Get the data size (rows) of a file without loading the data,
+        from its metadata sidecar.
+        Expected to overwrite superior methods.
+
+        :param file_data: file path to data.
+        :type file_data: str
+        :return: data size or None if unknown
+        :rtype: int or None
+        """
+        file_sidecar = self._get_file_sidecar(file_data=file_data)
+        if not os.path.isfile(file_sidecar) or not os.path.isfile(file_data):
+            return None
+        with open(file_sidecar) as f:
+            dict_meta = json.load(f)
+        # stale sidecar
+        if dict_meta["Mtime"] != os.path.getmtime(file_data):
+            return None
+        return dict_meta["Size"]
+
+    def _get_reader_args(self):
+        """Get the keyword arguments for reading the data file.
+        Expected to overwrite superior methods.
+
+        :return: reader arguments
+        :rtype: dict
+        """
+        # parse schema columns plus the ones needed by filters
+        list_columns = list(self.columns_data_dtypes.keys())
+        for column in self.columns_data_required + list(self.columns_data_filters):
+            if column not in list_columns:
+                list_columns.append(column)
+        return {
+            "sep": self.file_data_sep,
+            "engine": "c",
+            "dtype": dict(self.columns_data_dtypes),
+            "usecols": list_columns,
+        }
+
+    def _get_filtered_data(self, df):
+        """Get the rows matching the schema, dropping rows with missing
+        required values and rows out of the row filters.
+
+        :param df: incoming data table
+        :type df: :class:`pandas.DataFrame`
+        :return: filtered data table
+        :rtype: :class:`pandas.DataFrame`
+        """
+        df = df.dropna(subset=self.columns_data_required)
+        if not self.columns_data_filters:
+            return df
+        vct_mask = np.ones(len(df), dtype=bool)
+        for column, value in self.columns_data_filters.items():
+            sr = df[column]
+            if isinstance(value, tuple):
+                v_min, v_max = value
+                if v_min is not None:
+                    vct_mask &= (sr >= v_min).values
+                if v_max is not None:
+                    vct_mask &= (sr <= v_max).values
+            elif isinstance(value, (list, set)):
+                vct_mask &= sr.isin(list(value)).values
+            else:
+                vct_mask &= (sr == value).values
+        return df[vct_mask]
+
+    def iter_data(self, file_data=None, chunksize=None):
+        """Iterate over data chunks from file, without loading the full data.
+        Expected to overwrite superior methods.
+
+        :param file_data: file path to data. If None, it takes ``file_data``.
+        :type file_data: str
+        :param chunksize: number of rows per chunk. If None, it takes ``chunksize``.
+        :type chunksize: int
+        :return: generator of data chunks
+        :rtype: generator
+        """
+        if file_data is None:
+            file_data = self.file_data
+        if chunksize is None:
+            chunksize = self.chunksize
+        dict_reader = self._get_reader_args()
+        with pd.read_csv(file_data, chunksize=chunksize, **dict_reader) as reader:
+            for df in reader:
+                # -------------- post-loading logic -------------- #
+                yield self._get_filtered_data(df)
+
+    def count_data(self, file_data=None, chunksize=None):
+        """Count the data rows in file by streaming chunks.
+
+        :param file_data: file path to data. If None, it takes ``file_data``.
+        :type file_data: str
+        :param chunksize: number of rows per chunk. If None, it takes ``chunksize``.
+        :type chunksize: int
+        :return: number of data rows
+        :rtype: int
+        """
+        n_size = 0
+        for df in self.iter_data(file_data=file_data, chunksize=chunksize):
+            n_size = n_size + len(df)
+        return n_size
+
     def view(self, show=True):
         """Get a basic visualization.
         Expected to overwrite superior methods.
@@ -329,6 +562,9 @@ class DataSet(MbaE):
         **Notes:**
 
         - Uses values in the ``view_specs()`` attribute for plotting
+        - On large data (over ``max_points`` in ``auto`` mode), points are
+          binned into a density grid of ``bins`` x ``bins`` cells, so the
+          figure cost does not grow with the number of rows.
 
         **Examples:**
 
@@ -349,20 +585,76 @@ class DataSet(MbaE):
         >>> ds.view_specs["fig_format"] = "png"
         >>> ds.view(show=False)
 
+        Force the density grid:
+
+        >>> ds.view_specs["mode"] = "density"
+        >>> ds.view(show=True)
+
         """
+        import matplotlib.pyplot as plt
+
         # get specs
         specs = self.view_specs.copy()
+        sr_x = self.data[specs["xvar"]]
+        sr_y = self.data[specs["yvar"]]
+
+        # handle min max
+        if specs["xmin"] is None:
+            specs["xmin"] = sr_x.min()
+        if specs["ymin"] is None:
+            specs["ymin"] = sr_y.min()
+        if specs["xmax"] is None:
+            specs["xmax"] = sr_x.max()
+        if specs["ymax"] is None:
+            specs["ymax"] = sr_y.max()
 
         # --------------------- figure setup --------------------- #
         fig = plt.figure(figsize=(specs["width"], specs["height"]))  # Width, Height
 
         # --------------------- plotting --------------------- #
-        plt.scatter(
-            self.data[specs["xvar"]],
-            self.data[specs["yvar"]],
-            marker=".",
-            color=specs["color"],
-        )
+        mode = specs["mode"]
+        if mode == "auto":
+            mode = "density" if len(sr_x) > specs["max_points"] else "scatter"
+        if mode == "density":
+            import matplotlib.dates as mdates
+
+            # bin plain numbers (datetimes by their int64 nanoseconds)
+            vct_x = self._get_view_numbers(values=sr_x)
+            vct_y = self._get_view_numbers(values=sr_y)
+            vct_xlim = self._get_view_numbers(values=[specs["xmin"], specs["xmax"]])
+            vct_ylim = self._get_view_numbers(values=[specs["ymin"], specs["ymax"]])
+            grid = self.get_density_grid(
+                vct_x=vct_x,
+                vct_y=vct_y,
+                bins=specs["bins"],
+                extent=(*vct_xlim, *vct_ylim),
+            )
+            # image extent in axis units (dates as matplotlib date numbers)
+            list_extent = []
+            for sr, v_min, v_max in [
+                (sr_x, specs["xmin"], specs["xmax"]),
+                (sr_y, specs["ymin"], specs["ymax"]),
+            ]:
+                if pd.api.types.is_datetime64_any_dtype(sr):
+                    v_min, v_max = mdates.date2num(
+                        [pd.Timestamp(v_min), pd.Timestamp(v_max)]
+                    )
+                list_extent = list_extent + [v_min, v_max]
+            plt.imshow(
+                np.ma.masked_equal(grid.T, 0),
+                origin="lower",
+                extent=list_extent,
+                aspect="auto",
+                interpolation="nearest",
+                cmap=specs["cmap"],
+            )
+            # date axes keep the date formatter
+            if pd.api.types.is_datetime64_any_dtype(sr_x):
+                plt.gca().xaxis_date()
+            if pd.api.types.is_datetime64_any_dtype(sr_y):
+                plt.gca().yaxis_date()
+        else:
+            plt.scatter(sr_x, sr_y, marker=".", color=specs["color"])
 
         # --------------------- post-plotting --------------------- #
         # set basic plotting stuff
@@ -370,16 +662,6 @@ class DataSet(MbaE):
         plt.ylabel(specs["ylabel"])
         plt.xlabel(specs["xlabel"])
 
-        # handle min max
-        if specs["xmin"] is None:
-            specs["xmin"] = self.data[specs["xvar"]].min()
-        if specs["ymin"] is None:
-            specs["ymin"] = self.data[specs["yvar"]].min()
-        if specs["xmax"] is None:
-            specs["xmax"] = self.data[specs["xvar"]].max()
-        if specs["ymax"] is None:
-            specs["ymax"] = self.data[specs["yvar"]].max()
-
         plt.xlim(specs["xmin"], specs["xmax"])
         plt.ylim(specs["ymin"], 1.2 * specs["ymax"])
 
@@ -398,3 +680,52 @@ class DataSet(MbaE):
             plt.savefig(file_path, dpi=specs["dpi"])
             plt.close(fig)
             return file_path
+
+    @staticmethod
+    def _get_view_numbers(values):
+        """Get plain float values for binning, taking datetimes by their
+        int64 nanoseconds. Missing values are NaN.
+
+        :param values: incoming values
+        :type values: :class:`pandas.Series` or list
+        :return: float values
+        :rtype: :class:`numpy.ndarray`
+        """
+        sr = pd.Series(values)
+        if pd.api.types.is_datetime64_any_dtype(sr):
+            vct_ns = sr.to_numpy(dtype="datetime64[ns]").view(np.int64)
+            return np.where(sr.isna().values, np.nan, vct_ns.astype(float))
+        return sr.to_numpy(dtype=float)
+
+    @staticmethod
+    def get_density_grid(vct_x, vct_y, bins, extent):
+        """Get the point counts binned into a regular 2-D grid.
+        Points out of the extent or missing are ignored.
+
+        :param vct_x: x values
+        :type vct_x: :class:`numpy.ndarray`
+        :param vct_y: y values
+        :type vct_y: :class:`numpy.ndarray`
+        :param bins: number of cells per axis
+        :type bins: int
+        :param extent: grid limits ``(xmin, xmax, ymin, ymax)``
+        :type extent: tuple
+        :return: grid of counts, indexed by ``[x cell, y cell]``
+        :rtype: :class:`numpy.ndarray`
+        """
+        x_min, x_max, y_min, y_max = extent
+        vct_mask = (
+            (vct_x >= x_min) & (vct_x <= x_max) & (vct_y >= y_min) & (vct_y <= y_max)
+        )
+        vct_x = vct_x[vct_mask]
+        vct_y = vct_y[vct_mask]
+        # cell positions by direct arithmetic (uniform bins, no search)
+        x_span = (x_max - x_min) or 1.0
+        y_span = (y_max - y_min) or 1.0
+        vct_ix = ((vct_x - x_min) * (bins / x_span)).astype(np.int64)
+        vct_iy = ((vct_y - y_min) * (bins / y_span)).astype(np.int64)
+        # max values fall in the last cell
+        vct_ix = np.minimum(vct_ix, bins - 1)
+        vct_iy = np.minimum(vct_iy, bins - 1)
+        grid = np.bincount(vct_ix * bins + vct_iy, minlength=bins * bins)
+        return grid.reshape(bins, bins)
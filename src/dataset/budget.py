@@ -1,8 +1,21 @@
+import datetime
+import heapq
+
+import numpy as np
+import pandas as pd
+
 from .record_table import RecordTable
 
 
 class Budget(RecordTable):
     def __init__(self, name="MyBudget", alias="Bud"):
+        # prior attributes
+        self._totals = {"Revenue": 0.0, "Expense": 0.0}  # running totals
+        self._summary_cache = {}
+        self._summary_version = None  # table version of cached summaries
+        self._tag_index = {}  # tag -> set of row positions
+        self._due_heap = []  # (due datetime ns, row position) priority index
+
         super().__init__(name=name, alias=alias)
 
         # ------------- specifics attributes ------------- #
@@ -59,6 +72,15 @@ class Budget(RecordTable):
         self.columns_data = (
             self.columns_data_main + self.columns_data_extra + self.columns_data_files
         )
+        # Date columns and their textual formats (parsed shadow columns)
+        self.columns_data_dates = {"Date_Due": "ISO8601", "Date_Exe": "ISO8601"}
+        # Indexed main columns and their index kind (``hash`` or ``sorted``)
+        self.columns_data_indexes = {
+            "Type": "hash",
+            "Status": "hash",
+            "Contract": "hash",
+            "Value": "sorted",
+        }
 
         # variations
         self.columns_data_status = self.columns_data_main + [
@@ -76,34 +98,14 @@ class Budget(RecordTable):
         """
 
         # ------------- define sub routines here ------------- #
-        def func_file_status():
-            return FileSys.check_file_status(files=self.data["File"].values)
-
-        def func_update_status():
-            # filter relevante data
-            df = self.data[["Status", "Method", "Date_Due"]].copy()
-            # Convert 'Date_Due' to datetime format
-            df["Date_Due"] = pd.to_datetime(self.data["Date_Due"])
-            # Get the current date
-            current_dt = datetime.datetime.now()
-
-            # Update 'Status' for records with 'Automatic' method and 'Expected' status_t1 based on the condition
-            condition = (
-                (df["Method"] == "Automatic")
-                & (df["Status"] == "Expected")
-                & (df["Date_Due"] <= current_dt)
-            )
-            df.loc[condition, "Status"] = "Executed"
-
-            # return values
-            return df["Status"].values
+        def func_file_status(df):
+            return FileSys.check_file_status(files=df["File"].values)
 
         # todo implement all operations
         # ---------------- the operator ---------------- #
 
-        self.operator = {
-            "Status": func_update_status,
-        }
+        # 'Status' transitions are scheduled by the due-date index
+        self.operator = {}
 
     def _get_total_expenses(self, filter=True):
         filtered_df = self._filter_prospected_cancelled() if filter else self.data
@@ -115,68 +117,418 @@ class Budget(RecordTable):
         _n = filtered_df[filtered_df["Type"] == "Revenue"]["Value_Signed"].sum()
         return round(_n, 3)
 
-    def _filter_prospected_cancelled(self):
-        return self.data[
-            (self.data["Status"] != "Prospected") & (self.data["Status"] != "Cancelled")
-        ]
+    def _filter_prospected_cancelled(self, df=None):
+        if df is None:
+            df = self.data
+        return df[(df["Status"] != "Prospected") & (df["Status"] != "Cancelled")]
+
+    def _set_totals(self):
+        """Set the total attributes from the running totals.
+
+        :return: None
+        :rtype: None
+        """
+        self.total_revenue = round(self._totals["Revenue"], 3)
+        self.total_expenses = round(self._totals["Expense"], 3)
+        self.total_net = self.total_revenue + self.total_expenses
+        if self.total_net > 0:
+            self.summary_ascend = False
+        else:
+            self.summary_ascend = True
+        return None
+
+    def _build_totals(self):
+        """Recompute the running totals from the full data table.
+
+        :return: None
+        :rtype: None
+        """
+        if self._data is None:
+            self._totals = {"Revenue": 0.0, "Expense": 0.0}
+        else:
+            self._totals = {
+                "Revenue": self._get_total_revenue(filter=True),
+                "Expense": self._get_total_expenses(filter=True),
+            }
+        return None
+
+    def _add_to_totals(self, type, status, value_signed):
+        """Add a single entry to the running totals.
+
+        :param type: entry type (``Revenue`` or ``Expense``)
+        :type type: str
+        :param status: entry status
+        :type status: str
+        :param value_signed: signed value to add (negate it to remove an entry)
+        :type value_signed: float
+        :return: None
+        :rtype: None
+        """
+        if status in ["Prospected", "Cancelled"] or type not in self._totals:
+            return None
+        if pd.isna(value_signed):
+            return None
+        self._totals[type] = self._totals[type] + value_signed
+        return None
+
+    def _build_tag_index(self):
+        """Rebuild the tag to row positions index from the data table.
+
+        :return: None
+        :rtype: None
+        """
+        self._tag_index = {}
+        if self._data is not None:
+            self._add_to_tag_index(sr_tags=self._data["Tags"], n_start=0)
+        return None
+
+    def _add_to_tag_index(self, sr_tags, n_start):
+        """Add rows to the tag index by exploding their tags.
+
+        :param sr_tags: series of whitespace-separated tags
+        :type sr_tags: :class:`pandas.Series`
+        :param n_start: row position of the first row in the series
+        :type n_start: int
+        :return: None
+        :rtype: None
+        """
+        sr_split = pd.Series(
+            sr_tags.fillna("").astype(str).str.split().values,
+            index=range(n_start, n_start + len(sr_tags)),
+        )
+        sr_exploded = sr_split.explode().dropna()
+        dict_groups = sr_exploded.index.groupby(sr_exploded.values)
+        for tag in dict_groups:
+            if tag not in self._tag_index:
+                self._tag_index[tag] = set()
+            self._tag_index[tag].update(dict_groups[tag])
+        return None
+
+    def get_records_by_tags(self, tags, match="all"):
+        """Get the records holding a combination of tags.
+
+        :param tags: list of tags
+        :type tags: list
+        :param match: ``all`` for records holding every tag, ``any`` for
+            records holding at least one tag
+        :type match: str
+        :return: records with the tags
+        :rtype: :class:`pandas.DataFrame`
+        """
+        # materialize pending records
+        self.flush()
+        list_sets = [self._tag_index.get(tag, set()) for tag in tags]
+        if len(list_sets) == 0:
+            set_pos = set()
+        elif match == "all":
+            set_pos = set.intersection(*list_sets)
+        else:
+            set_pos = set.union(*list_sets)
+        return self._data.iloc[sorted(set_pos)]
+
+    def _get_due_items(self, input_df, n_start):
+        """Get the due-date index items of scheduled entries, that is,
+        entries with ``Automatic`` method and ``Expected`` status.
+
+        :param input_df: budget rows
+        :type input_df: dataframe
+        :param n_start: row position of the first row
+        :type n_start: int
+        :return: list of (due datetime ns, row position) items
+        :rtype: list
+        """
+        sr_due = self.get_dates(field="Date_Due", df=input_df)
+        vct_mask = (
+            (input_df["Method"] == "Automatic")
+            & (input_df["Status"] == "Expected")
+            & sr_due.notna()
+        ).values
+        vct_pos = np.arange(n_start, n_start + len(input_df))[vct_mask]
+        vct_due = sr_due.values[vct_mask].astype("datetime64[ns]").astype(np.int64)
+        return list(zip(vct_due.tolist(), vct_pos.tolist()))
+
+    def _build_due_index(self):
+        """Rebuild the due-date priority index from the data table.
+
+        :return: None
+        :rtype: None
+        """
+        if self._data is None:
+            self._due_heap = []
+        else:
+            self._due_heap = self._get_due_items(input_df=self._data, n_start=0)
+            heapq.heapify(self._due_heap)
+        return None
+
+    def _update_due_status(self):
+        """Set ``Executed`` status on scheduled entries that became due,
+        popping them from the due-date index.
+
+        :return: number of updated entries
+        :rtype: int
+        """
+        n_now = pd.Timestamp(datetime.datetime.now()).value
+        n_updated = 0
+        columns = self._data.columns
+        while len(self._due_heap) > 0 and self._due_heap[0][0] <= n_now:
+            n_due, n_pos = heapq.heappop(self._due_heap)
+            # skip entries edited after indexing
+            list_items = self._get_due_items(
+                input_df=self._data.iloc[[n_pos]], n_start=n_pos
+            )
+            if (n_due, n_pos) not in list_items:
+                continue
+            rec_id = self._data.iat[n_pos, columns.get_loc(self.recid_field)]
+            self._set_record_values(rec_id=rec_id, dict_rec={"Status": "Executed"})
+            n_updated = n_updated + 1
+        return n_updated
+
+    def refresh_data(self):
+        """Refresh data method for the object operator.
+        Expected to increment superior methods.
+
+        :return: None
+        :rtype: None
+        """
+        # materialize pending records
+        self.flush()
+        # recomputed status is not an unsaved change
+        is_saved = self._version == self._version_saved
+        if self._data is not None:
+            self._update_due_status()
+        super().refresh_data()
+        if is_saved:
+            self._version_saved = self._version
+
+    def _on_rebuild(self):
+        super()._on_rebuild()
+        self._build_totals()
+        self._build_tag_index()
+        self._build_due_index()
+
+    def _on_insert(self, input_df, n_start):
+        super()._on_insert(input_df=input_df, n_start=n_start)
+        self._add_to_tag_index(sr_tags=input_df["Tags"], n_start=n_start)
+        for item in self._get_due_items(input_df=input_df, n_start=n_start):
+            heapq.heappush(self._due_heap, item)
+        df = self._filter_prospected_cancelled(df=input_df)
+        sr_values = df.groupby("Type")[self.value_signed].sum()
+        for k in self._totals:
+            self._totals[k] = self._totals[k] + sr_values.get(k, 0)
+        self._set_totals()
+
+    def _on_edit(self, n_pos, dict_old, dict_new):
+        super()._on_edit(n_pos=n_pos, dict_old=dict_old, dict_new=dict_new)
+        # move row in tag index
+        if "Tags" in dict_new:
+            for tag in str(dict_old["Tags"]).split():
+                self._tag_index.get(tag, set()).discard(n_pos)
+            self._add_to_tag_index(
+                sr_tags=pd.Series([dict_new["Tags"]]), n_start=n_pos
+            )
+        # reschedule row in due-date index
+        if len(set(dict_new) & {"Method", "Status", "Date_Due"}) > 0:
+            for item in self._get_due_items(
+                input_df=self._data.iloc[[n_pos]], n_start=n_pos
+            ):
+                heapq.heappush(self._due_heap, item)
+        columns = self._data.columns
+        # current row values
+        dict_row = {
+            k: self._data.iat[n_pos, columns.get_loc(k)]
+            for k in ["Type", "Status", "Value", self.value_signed]
+        }
+        # previous row values
+        dict_row_old = dict(dict_row)
+        dict_row_old.update({k: dict_old[k] for k in dict_old if k in dict_row})
+        # refresh sign and value_signed
+        if "Type" in dict_new or "Value" in dict_new:
+            n_sign = 1 if dict_row["Type"] == "Revenue" else -1
+            dict_row["Value"] = pd.to_numeric(dict_row["Value"])
+            dict_row[self.value_signed] = n_sign * dict_row["Value"]
+            self._data.iat[n_pos, columns.get_loc("Value")] = dict_row["Value"]
+            self._data.iat[n_pos, columns.get_loc(self.sign_field)] = n_sign
+            self._data.iat[n_pos, columns.get_loc(self.value_signed)] = dict_row[
+                self.value_signed
+            ]
+        # move entry in running totals
+        self._add_to_totals(
+            type=dict_row_old["Type"],
+            status=dict_row_old["Status"],
+            value_signed=-dict_row_old[self.value_signed],
+        )
+        self._add_to_totals(
+            type=dict_row["Type"],
+            status=dict_row["Status"],
+            value_signed=dict_row[self.value_signed],
+        )
+        self._set_totals()
+
+    def _on_edit_rows(self, vct_pos, columns):
+        super()._on_edit_rows(vct_pos=vct_pos, columns=columns)
+        set_columns = set(columns)
+        if "Tags" in set_columns:
+            self._build_tag_index()
+        if len(set_columns & {"Method", "Status", "Date_Due"}) > 0:
+            self._build_due_index()
+        # refresh sign and value_signed
+        if len(set_columns & {"Type", "Value"}) > 0:
+            df = self._data.iloc[vct_pos]
+            vct_value = pd.to_numeric(df["Value"]).values
+            vct_sign = np.where(df["Type"].values == "Revenue", 1, -1)
+            columns = self._data.columns
+            self._data.iloc[vct_pos, columns.get_loc("Value")] = vct_value
+            self._data.iloc[vct_pos, columns.get_loc(self.sign_field)] = vct_sign
+            self._data.iloc[vct_pos, columns.get_loc(self.value_signed)] = (
+                vct_sign * vct_value
+            )
+        if len(set_columns & {"Type", "Status", "Value"}) > 0:
+            self._build_totals()
+            self._set_totals()
+
+    def _on_refresh(self, columns):
+        super()._on_refresh(columns=columns)
+        set_columns = set(columns)
+        if "Tags" in set_columns:
+            self._build_tag_index()
+        if len(set_columns & {"Method", "Status", "Date_Due"}) > 0:
+            self._build_due_index()
+        # the operator may change any status
+        if len(set_columns & {"Type", "Status", "Value"}) > 0:
+            self._build_totals()
 
     def update(self):
         super().update()
-        if self.data is not None:
-            self.total_revenue = self._get_total_revenue(filter=True)
-            self.total_expenses = self._get_total_expenses(filter=True)
-            self.total_net = self.total_revenue + self.total_expenses
-            if self.total_net > 0:
-                self.summary_ascend = False
-            else:
-                self.summary_ascend = True
+        if self._file_lazy is None and self.data is not None:
+            self._set_totals()
 
         # ... continues in downstream objects ... #
         return None
 
-    def set_data(self, input_df):
-        """Set RecordTable data from incoming dataframe.
-        Expected to be incremented downstream.
+    def _prepare_data(self, input_df):
+        """Prepare incoming normalized data before it is merged to the table.
+        Expected to increment superior methods.
 
         :param input_df: incoming dataframe
         :type input_df: dataframe
-        :return: None
-        :rtype: None
+        :return: prepared dataframe
+        :rtype: dataframe
         """
-        super().set_data(input_df=input_df)
+        input_df = super()._prepare_data(input_df=input_df)
         # convert to numeric
-        self.data["Value"] = pd.to_numeric(self.data["Value"])
+        input_df["Value"] = pd.to_numeric(input_df["Value"])
         # compute temporary field
 
         # sign and value_signed
-        self.data["Sign"] = self.data["Type"].apply(
+        input_df[self.sign_field] = input_df["Type"].apply(
             lambda x: 1 if x == "Revenue" else -1
         )
-        self.data["Value_Signed"] = self.data["Sign"] * self.data["Value"]
+        input_df[self.value_signed] = input_df[self.sign_field] * input_df["Value"]
+        return input_df
+
+    def get_totals_from_file(self, file_data=None, chunksize=None):
+        """Compute the budget totals from file by streaming chunks,
+        without loading the full table.
+
+        :param file_data: file path to data. If None, it takes ``file_data``.
+        :type file_data: str
+        :param chunksize: number of rows per chunk. If None, it takes ``chunksize``.
+        :type chunksize: int
+        :return: dictionary of totals
+        :rtype: dict
+        """
+        total_revenue = 0
+        total_expenses = 0
+        for df in self.iter_data(file_data=file_data, chunksize=chunksize):
+            df = self._filter_prospected_cancelled(df=df)
+            sr_values = df.groupby("Type")[self.value_signed].sum()
+            total_revenue = total_revenue + sr_values.get("Revenue", 0)
+            total_expenses = total_expenses + sr_values.get("Expense", 0)
+        total_revenue = round(total_revenue, 3)
+        total_expenses = round(total_expenses, 3)
+        return {
+            "Total_Expenses": total_expenses,
+            "Total_Revenue": total_revenue,
+            "Total_Net": total_revenue + total_expenses,
+        }
 
     @staticmethod
-    def parse_annual_budget(self, year, budget_df, freq_field="Freq"):
+    def parse_annual_budget(
+        year, budget_df, freq_field="Freq", n_years=1, date_field="Date"
+    ):
+        """Util static method for expanding recurring budget entries
+        into dated occurrences over a horizon of years.
+
+        All rows sharing a frequency share the same dates, so each frequency
+        is computed once and rows are expanded by repeat and tile.
+
+        :param year: first year of the horizon
+        :type year: int
+        :param budget_df: recurring budget entries
+        :type budget_df: :class:`pandas.DataFrame`
+        :param freq_field: name of the pandas frequency column (ex: ``MS``, ``QS``)
+        :type freq_field: str
+        :param n_years: number of years in the horizon
+        :type n_years: int
+        :param date_field: name of the occurrence date column to create
+        :type date_field: str
+        :return: expanded budget, one row per occurrence
+        :rtype: :class:`pandas.DataFrame`
+        """
         start_date = "{}-01-01".format(year)
-        end_date = "{}-01-01".format(int(year) + 1)
-
-        annual_budget = pd.DataFrame()
+        end_date = "{}-01-01".format(int(year) + n_years)
 
-        for _, row in budget_df.iterrows():
+        list_pos = []
+        list_dates = []
+        sr_freq = budget_df[freq_field]
+        dict_groups = sr_freq.groupby(sr_freq, sort=False).indices
+        for freq in dict_groups:
             # Generate date range based on frequency
-            dates = pd.date_range(start=start_date, end=end_date, freq=row["Freq"])
+            dates = pd.date_range(
+                start=start_date, end=end_date, freq=freq, inclusive="left"
+            ).values
+            # Replicate the rows for each date
+            vct_pos = dict_groups[freq]
+            list_pos.append(np.repeat(vct_pos, len(dates)))
+            list_dates.append(np.tile(dates, len(vct_pos)))
+
+        if len(list_pos) == 0:
+            annual_budget = budget_df.iloc[0:0].copy()
+            annual_budget[date_field] = pd.Series(dtype="datetime64[ns]")
+            return annual_budget
+
+        vct_pos = np.concatenate(list_pos)
+        vct_dates = np.concatenate(list_dates)
+        # keep input row order, then dates
+        vct_order = np.lexsort((vct_dates, vct_pos))
+        annual_budget = budget_df.iloc[vct_pos[vct_order]].reset_index(drop=True)
+        annual_budget[date_field] = vct_dates[vct_order]
+        return annual_budget
 
-            # Replicate the row for each date
-            replicated_data = pd.DataFrame(
-                {col: [row[col]] * len(dates) for col in df.columns}
-            )
-            replicated_data["Date"] = dates
+    def _get_summary(self, key, func):
+        """Get a summary from the cache, computing it only if the data table
+        changed since it was cached.
 
-            # Append to the expanded budget
-            annual_budget = pd.concat(
-                [annual_budget, replicated_data], ignore_index=True
-            )
+        .. note::
 
-        return annual_budget
+            Only changes made through the ``RecordTable`` methods are tracked.
+
+
+        :param key: summary cache key
+        :type key: tuple
+        :param func: function that computes the summary
+        :type func: function
+        :return: summary
+        :rtype: object
+        """
+        # materialize pending records
+        self.flush()
+        if self._summary_version != self._version:
+            self._summary_cache = {}
+            self._summary_version = self._version
+        if key not in self._summary_cache:
+            self._summary_cache[key] = func()
+        return self._summary_cache[key]
 
     def get_summary_by_type(self):
         summary = pd.DataFrame(
@@ -192,32 +544,53 @@ class Budget(RecordTable):
         return summary
 
     def get_summary_by_status(self, filter=True):
-        filtered_df = self._filter_prospected_cancelled() if filter else self.data
-        return (
-            filtered_df.groupby("Status")["Value_Signed"]
-            .sum()
-            .sort_values(ascending=self.summary_ascend)
-        )
+        def func_summary():
+            filtered_df = self._filter_prospected_cancelled() if filter else self.data
+            return (
+                filtered_df.groupby("Status")["Value_Signed"]
+                .sum()
+                .sort_values(ascending=self.summary_ascend)
+            )
+
+        return self._get_summary(key=("Status", filter), func=func_summary)
 
     def get_summary_by_contract(self, filter=True):
-        filtered_df = self._filter_prospected_cancelled() if filter else self.data
-        return (
-            filtered_df.groupby("Contract")["Value_Signed"]
-            .sum()
-            .sort_values(ascending=self.summary_ascend)
-        )
+        def func_summary():
+            filtered_df = self._filter_prospected_cancelled() if filter else self.data
+            return (
+                filtered_df.groupby("Contract")["Value_Signed"]
+                .sum()
+                .sort_values(ascending=self.summary_ascend)
+            )
+
+        return self._get_summary(key=("Contract", filter), func=func_summary)
 
     def get_summary_by_tags(self, filter=True):
-        filtered_df = self._filter_prospected_cancelled() if filter else self.data
-        tags_summary = (
-            filtered_df.groupby("Tags")["Value_Signed"]
-            .sum()
-            .sort_values(ascending=self.summary_ascend)
-        )
-        tags_summary = tags_summary.sort()
-        separate_tags_summary = (
-            filtered_df["Tags"].str.split(expand=True).stack().value_counts()
-        )
-        print(type(separate_tags_summary))
-        return tags_summary, separate_tags_summary
+        """Get the signed value sum and record count for each individual tag,
+        computed from the tag index.
+
+        :param filter: option for filtering prospected and cancelled entries
+        :type filter: bool
+        :return: summary indexed by tag with ``Value_Signed`` and ``Count``
+        :rtype: :class:`pandas.DataFrame`
+        """
+
+        def func_summary():
+            vct_values = self._data[self.value_signed].values
+            vct_valid = ~self._data["Status"].isin(["Prospected", "Cancelled"]).values
+            dict_summary = {}
+            for tag in self._tag_index:
+                vct_pos = np.fromiter(self._tag_index[tag], dtype=int)
+                if filter:
+                    vct_pos = vct_pos[vct_valid[vct_pos]]
+                if len(vct_pos) > 0:
+                    dict_summary[tag] = (vct_values[vct_pos].sum(), len(vct_pos))
+            tags_summary = pd.DataFrame.from_dict(
+                dict_summary, orient="index", columns=[self.value_signed, "Count"]
+            )
+            return tags_summary.sort_values(
+                by=self.value_signed, ascending=self.summary_ascend
+            )
+
+        return self._get_summary(key=("Tags", filter), func=func_summary)
 
@@ -1,3 +1,11 @@
+import datetime
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
 from .base import DataSet
 
 
@@ -77,6 +85,13 @@ class RecordTable(DataSet):
         }
         rt.insert_record(dict_rec=d2)
 
+    Insert Many Records
+
+    .. code-block:: python
+
+        # Insert many records at once (flushed on the next read or save)
+        rt.insert_records(list_recs=[d2, d2, d2])
+
     Edit Record
 
     .. code-block:: python
@@ -95,6 +110,16 @@ class RecordTable(DataSet):
         # Archive a record in the RT, that is ``RecStatus`` = ``Off``
         rt.archive_record(rec_id="Rec0003")
 
+    Journaled Saves
+
+    .. code-block:: python
+
+        # Append only the record operations to a journal file on save
+        rt.journal = True
+        rt.save()
+        # Rewrite the full table and remove the journal
+        rt.compact()
+
     Get a Record Dict by ID
 
     .. code-block:: python
@@ -136,6 +161,22 @@ class RecordTable(DataSet):
 
     def __init__(self, name="MyRecordTable", alias="RcT"):
         # prior attributes
+        self._data = None
+        self._index = {}  # RecId -> row position
+        self._buffer = []  # pending records to append
+        self._last_id = 0  # RecId integer high-water mark
+        self._journal = []  # pending journal operations
+        self._journal_size = 0  # operations in the journal file
+        self._journal_synced = False  # file data + journal match data
+        self._version_saved = 0  # version matching the file data
+        self._history = []  # pending history entries (reverse deltas)
+        self._history_index = None  # RecId -> history entries (None: unbuilt)
+        self._history_index_file = None  # file data of the history index
+        self._version = 0  # bumped by every tracked data change
+        self._changed_columns = None  # changed since last refresh (None: all)
+        self._dirty_rows = None  # changed since last refresh (None: all)
+        self._dates = {}  # date field -> parsed datetimes (shadow columns)
+        self._indexes = {}  # field -> secondary index (None: stale)
 
         # ------------ call super ----------- #
         super().__init__(name=name, alias=alias)
@@ -143,12 +184,19 @@ class RecordTable(DataSet):
         self.object_alias = "FS"
 
         # --------- defaults --------- #
-        self.id_size = 4  # for zfill
+        self.id_size = 4  # for zfill (minimal width)
+        self.id_prefix = "Rec"
+        self.timestamp_format = "%Y-%m-%d %H:%M:%S"
+        self.file_data_format = "csv"  # storage backend
+        self.journal = False  # option for journaled saves
+        self.journal_max = 1000  # journal operations before compaction
+        self.history = False  # option for keeping the version history
 
         # --------- customizations --------- #
         self._set_base_columns()
         self._set_data_columns()
         self._set_operator()
+        self._set_storage()
 
         # UPDATE
         self.update()
@@ -200,39 +248,775 @@ class RecordTable(DataSet):
         self.columns_data = (
             self.columns_data_main + self.columns_data_extra + self.columns_data_files
         )
+        # Date columns and their textual formats (parsed shadow columns)
+        self.columns_data_dates = {}
+        # Indexed main columns and their index kind (``hash`` or ``sorted``)
+        self.columns_data_indexes = {"Kind": "hash", "Value": "sorted"}
         # ... continues in downstream objects ... #
 
     def _set_operator(self):
         """Set the builtin operator for automatic column calculations.
         This is a Base and Dummy method. It is expected to be overwrited and implemented downstream.
 
+        Each operator column declares its ``inputs`` columns and a vectorized
+        ``func`` that takes the data table and returns the column values.
+        Set ``time`` to True for columns that depend on the current time and
+        ``rowwise`` to False for columns that depend on other rows.
+
         :return: None
         :rtype: None
         """
 
         # ------------- define sub routines here ------------- #
 
-        def func_file_status():
-            return FileSys.check_file_status(files=self.data["File"].values)
+        def func_file_status(df):
+            return FileSys.check_file_status(files=df["File"].values)
 
-        def func_sum():
-            return None
+        def func_sum(df):
+            return df["Value"] + df["Extra"]
 
-        def func_age():
+        def func_age(df):
             return RecordTable.running_time(
-                start_datetimes=self.data["Date_Birth"], kind="human"
+                start_datetimes=self.get_dates(field="Date_Birth", df=df),
+                kind="human",
             )
 
         # ---------------- the operator ---------------- #
         self.operator = {
-            "Sum": func_sum,
-            "Age": func_age,
-            "File_Status": func_file_status,
+            "Sum": {"inputs": ["Value", "Extra"], "func": func_sum},
+            "Age": {"inputs": ["Date_Birth"], "func": func_age, "time": True},
+            "File_Status": {"inputs": ["File"], "func": func_file_status},
         }
         # remove here for downstream objects!
         self.operator = None
         return None
 
+    def _set_storage(self):
+        """Set the storage backends for reading and writing the data table.
+        Base method. Expected to be incremented downstream with custom backends.
+
+        .. note::
+
+            The ``parquet`` and ``feather`` backends require ``pyarrow``
+            (the ``columnar`` extra).
+
+        :return: None
+        :rtype: None
+        """
+
+        # ------------- define sub routines here ------------- #
+
+        def func_check_pyarrow():
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "The parquet and feather storage backends require pyarrow. "
+                    "Install the columnar extra: pip install 'zenith[columnar]'"
+                ) from e
+
+        def func_read_csv(file_path, columns=None):
+            return pd.read_csv(file_path, sep=self.file_data_sep, usecols=columns)
+
+        def func_iter_csv(file_path, chunksize):
+            with pd.read_csv(
+                file_path, sep=self.file_data_sep, chunksize=chunksize
+            ) as reader:
+                for df in reader:
+                    yield df
+
+        def func_write_csv(df, file_path):
+            self._get_text_df(df).to_csv(
+                file_path, sep=self.file_data_sep, index=False
+            )
+
+        def func_size_csv(file_path):
+            # csv has no metadata, so it takes the sidecar
+            return DataSet._get_file_size(self, file_data=file_path)
+
+        def func_read_parquet(file_path, columns=None):
+            func_check_pyarrow()
+            return pd.read_parquet(file_path, columns=columns)
+
+        def func_iter_parquet(file_path, chunksize):
+            func_check_pyarrow()
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(file_path)
+            for batch in parquet_file.iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+
+        def func_write_parquet(df, file_path):
+            func_check_pyarrow()
+            self._set_base_dtypes(df).to_parquet(file_path, index=False)
+
+        def func_size_parquet(file_path):
+            func_check_pyarrow()
+            import pyarrow.parquet as pq
+
+            return pq.ParquetFile(file_path).metadata.num_rows
+
+        def func_read_feather(file_path, columns=None):
+            func_check_pyarrow()
+            return pd.read_feather(file_path, columns=columns)
+
+        def func_iter_feather(file_path, chunksize):
+            func_check_pyarrow()
+            # feather is memory-mapped, so slicing is cheap
+            df = pd.read_feather(file_path)
+            for i in range(0, len(df), chunksize):
+                yield df.iloc[i : i + chunksize]
+
+        def func_write_feather(df, file_path):
+            func_check_pyarrow()
+            self._set_base_dtypes(df).reset_index(drop=True).to_feather(file_path)
+
+        def func_size_feather(file_path):
+            func_check_pyarrow()
+            import pyarrow as pa
+
+            with pa.memory_map(file_path) as source:
+                reader = pa.ipc.open_file(source)
+                return sum(
+                    reader.get_batch(i).num_rows
+                    for i in range(reader.num_record_batches)
+                )
+
+        # ---------------- the storage ---------------- #
+        self.storage = {
+            "csv": {
+                "extension": ".csv",
+                "read": func_read_csv,
+                "iter": func_iter_csv,
+                "write": func_write_csv,
+                "size": func_size_csv,
+            },
+            "parquet": {
+                "extension": ".parquet",
+                "read": func_read_parquet,
+                "iter": func_iter_parquet,
+                "write": func_write_parquet,
+                "size": func_size_parquet,
+            },
+            "feather": {
+                "extension": ".feather",
+                "read": func_read_feather,
+                "iter": func_iter_feather,
+                "write": func_write_feather,
+                "size": func_size_feather,
+            },
+        }
+        return None
+
+    def _get_file_format(self, file_path):
+        """Get the storage format of a file based on its extension.
+        Falls back to the table ``file_data_format``.
+
+        :param file_path: path to file
+        :type file_path: str
+        :return: storage format name
+        :rtype: str
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        for k in self.storage:
+            if self.storage[k]["extension"] == extension:
+                return k
+        return self.file_data_format
+
+    def _set_base_dtypes(self, df):
+        """Set the compact dtypes of base columns in a dataframe:
+        ``RecTable`` as category, ``RecStatus`` as boolean (``On`` is True)
+        and ``RecTimestamp`` as datetime.
+
+        :param df: data table
+        :type df: :class:`pandas.DataFrame`
+        :return: data table with compact base columns
+        :rtype: :class:`pandas.DataFrame`
+        """
+        dtype_table = pd.CategoricalDtype(categories=[self.name])
+        if df[self.rectable_field].dtype != dtype_table:
+            df[self.rectable_field] = df[self.rectable_field].astype(dtype_table)
+        sr_status = df[self.recstatus_field]
+        if not pd.api.types.is_bool_dtype(sr_status):
+            df[self.recstatus_field] = ~sr_status.astype(str).isin(["Off", "False"])
+        sr_timest = df[self.rectimest_field]
+        if not pd.api.types.is_datetime64_any_dtype(sr_timest):
+            df[self.rectimest_field] = self._parse_datetime(sr_timest)
+        return df
+
+    def _get_text_df(self, df):
+        """Get a copy of the data table with base columns in textual form.
+
+        :param df: data table
+        :type df: :class:`pandas.DataFrame`
+        :return: data table with textual base columns
+        :rtype: :class:`pandas.DataFrame`
+        """
+        df = df.copy()
+        df[self.recstatus_field] = np.where(
+            df[self.recstatus_field].astype(bool), "On", "Off"
+        )
+        df[self.rectimest_field] = df[self.rectimest_field].dt.strftime(
+            self.timestamp_format
+        )
+        return df
+
+    def _parse_datetime(self, sr_datetime, format=None):
+        """Parse a series of datetime strings.
+        It tries the explicit format first and falls back to mixed formats.
+
+        :param sr_datetime: series of datetime strings
+        :type sr_datetime: :class:`pandas.Series`
+        :param format: datetime format. If None, it takes ``timestamp_format``
+        :type format: str
+        :return: series of datetimes
+        :rtype: :class:`pandas.Series`
+        """
+        if format is None:
+            format = self.timestamp_format
+        try:
+            return pd.to_datetime(sr_datetime, format=format)
+        except (ValueError, TypeError):
+            return pd.to_datetime(sr_datetime, format="mixed")
+
+    @property
+    def data(self):
+        """The record data table.
+
+        :return: record data table
+        :rtype: :class:`pandas.DataFrame`
+        """
+        self._load_lazy()
+        # materialize pending records
+        if self._buffer:
+            self.flush()
+        return self._data
+
+    @data.setter
+    def data(self, input_df):
+        self._data = input_df
+        self._on_rebuild()
+
+    def _on_rebuild(self):
+        """Track a full replacement of the data table.
+        Base method. Expected to be incremented downstream.
+
+        :return: None
+        :rtype: None
+        """
+        self._build_index()
+        self._build_last_id()
+        self._build_dates()
+        self._build_indexes()
+        # bulk changes are not journaled
+        self._journal_synced = False
+        self._version = self._version + 1
+        self._changed_columns = None
+        self._dirty_rows = None
+        # ... continues in downstream objects ... #
+        return None
+
+    def _on_insert(self, input_df, n_start):
+        """Track new rows appended to the data table.
+        Base method. Expected to be incremented downstream.
+
+        :param input_df: appended rows
+        :type input_df: dataframe
+        :param n_start: row position of the first appended row
+        :type n_start: int
+        :return: None
+        :rtype: None
+        """
+        # append to index
+        self._index.update(
+            zip(
+                input_df[self.recid_field].values,
+                range(n_start, n_start + len(input_df)),
+            )
+        )
+        # append to date shadow columns
+        for k in self.columns_data_dates:
+            if k in input_df.columns and (k in self._dates or n_start == 0):
+                vct_dates = self._get_parsed_dates(field=k, sr_dates=input_df[k])
+                vct_prev = self._dates.get(k, vct_dates[:0])
+                self._dates[k] = np.concatenate([vct_prev, vct_dates])
+        # append to secondary indexes
+        for k in self.columns_data_indexes:
+            if k not in self._data.columns:
+                continue
+            if k not in self._indexes:
+                # first indexed rows
+                self._build_indexes(columns=[k])
+            elif self.columns_data_indexes[k] == "hash":
+                self._add_to_hash_index(
+                    field=k, sr_values=input_df[k], n_start=n_start
+                )
+            else:
+                self._add_to_sorted_index(
+                    field=k, sr_values=input_df[k], n_start=n_start
+                )
+        self._version = self._version + 1
+        self._changed_columns = None
+        if self._dirty_rows is not None:
+            self._dirty_rows.update(range(n_start, n_start + len(input_df)))
+        # ... continues in downstream objects ... #
+        return None
+
+    def _on_edit(self, n_pos, dict_old, dict_new):
+        """Track values edited in place in a row of the data table.
+        Base method. Expected to be incremented downstream.
+
+        :param n_pos: row position
+        :type n_pos: int
+        :param dict_old: previous values of edited fields
+        :type dict_old: dict
+        :param dict_new: new values of edited fields
+        :type dict_new: dict
+        :return: None
+        :rtype: None
+        """
+        # update date shadow columns
+        for k in set(dict_new) & set(self._dates):
+            sr_dates = pd.Series([dict_new[k]], dtype=object)
+            vct_dates = self._get_parsed_dates(field=k, sr_dates=sr_dates)
+            self._dates[k][n_pos] = vct_dates[0]
+        # move row in secondary indexes
+        for k in set(dict_new) & set(self.columns_data_indexes):
+            if k not in self._indexes:
+                self._build_indexes(columns=[k])
+            elif self.columns_data_indexes[k] == "hash":
+                self._indexes[k].get(dict_old[k], set()).discard(n_pos)
+                self._add_to_hash_index(
+                    field=k, sr_values=pd.Series([dict_new[k]]), n_start=n_pos
+                )
+            else:
+                self._remove_from_sorted_index(
+                    field=k, value=dict_old[k], n_pos=n_pos
+                )
+                self._add_to_sorted_index(
+                    field=k, sr_values=self._data[k].iloc[[n_pos]], n_start=n_pos
+                )
+        self._version = self._version + 1
+        if self._changed_columns is not None:
+            self._changed_columns.update(dict_new.keys())
+        if self._dirty_rows is not None:
+            self._dirty_rows.add(n_pos)
+        # ... continues in downstream objects ... #
+        return None
+
+    def _on_edit_rows(self, vct_pos, columns):
+        """Track values edited in place in many rows of the data table.
+        Base method. Expected to be incremented downstream.
+
+        :param vct_pos: row positions
+        :type vct_pos: :class:`numpy.ndarray`
+        :param columns: edited columns
+        :type columns: list
+        :return: None
+        :rtype: None
+        """
+        # update date shadow columns
+        for k in set(columns) & set(self._dates):
+            self._dates[k][vct_pos] = self._get_parsed_dates(
+                field=k, sr_dates=self._data[k].iloc[vct_pos]
+            )
+        # rebuild secondary indexes of edited columns
+        self._build_indexes(columns=columns)
+        self._version = self._version + 1
+        if self._changed_columns is not None:
+            self._changed_columns.update(columns)
+        if self._dirty_rows is not None:
+            self._dirty_rows.update(vct_pos.tolist())
+        # ... continues in downstream objects ... #
+        return None
+
+    def _on_refresh(self, columns):
+        """Track columns recomputed by the operator.
+        Base method. Expected to be incremented downstream.
+
+        :param columns: recomputed columns
+        :type columns: list
+        :return: None
+        :rtype: None
+        """
+        if len(columns) > 0:
+            # recomputed columns are replaced as a whole
+            self._build_dates(columns=columns)
+            self._build_indexes(columns=columns)
+            self._version = self._version + 1
+        # ... continues in downstream objects ... #
+        return None
+
+    def _build_index(self):
+        """Build the ``RecId`` to row position index from the data table.
+
+        :return: None
+        :rtype: None
+        """
+        if self._data is None:
+            self._index = {}
+        else:
+            self._index = dict(
+                zip(self._data[self.recid_field].values, range(len(self._data)))
+            )
+        return None
+
+    def _build_indexes(self, columns=None):
+        """Build the secondary indexes of declared main columns.
+        Hash indexes are built right away and sorted indexes on first lookup.
+
+        :param columns: columns to rebuild. If None, all indexes are rebuilt
+        :type columns: list
+        :return: None
+        :rtype: None
+        """
+        if columns is None:
+            self._indexes = {}
+        if self._data is not None:
+            if columns is None:
+                columns = list(self.columns_data_indexes)
+            for k in columns:
+                if k not in self.columns_data_indexes or k not in self._data.columns:
+                    continue
+                self._indexes[k] = None
+                if self.columns_data_indexes[k] == "hash":
+                    self._indexes[k] = {}
+                    self._add_to_hash_index(
+                        field=k, sr_values=self._data[k], n_start=0
+                    )
+        return None
+
+    def _add_to_hash_index(self, field, sr_values, n_start):
+        """Add rows to the hash index of a field.
+
+        :param field: indexed field
+        :type field: str
+        :param sr_values: series of field values
+        :type sr_values: :class:`pandas.Series`
+        :param n_start: row position of the first row in the series
+        :type n_start: int
+        :return: None
+        :rtype: None
+        """
+        dict_index = self._indexes[field]
+        vct_pos = np.arange(n_start, n_start + len(sr_values))
+        dict_groups = pd.Index(vct_pos).groupby(sr_values.values)
+        for value in dict_groups:
+            if value not in dict_index:
+                dict_index[value] = set()
+            dict_index[value].update(dict_groups[value])
+        return None
+
+    def _get_sorted_index(self, field):
+        """Get the sorted index of a field, building it if stale.
+
+        :param field: indexed field
+        :type field: str
+        :return: tuple of sorted values and their row positions (None if
+            values are not orderable)
+        :rtype: tuple or None
+        """
+        if self._indexes.get(field) is None:
+            vct_values = self._data[field].values
+            # missing values never match a criterion
+            vct_pos = np.flatnonzero(~pd.isna(vct_values))
+            try:
+                vct_order = vct_pos[np.argsort(vct_values[vct_pos], kind="stable")]
+            except TypeError:
+                # unorderable mixed values
+                return None
+            self._indexes[field] = (vct_values[vct_order], vct_order)
+        return self._indexes[field]
+
+    def _add_to_sorted_index(self, field, sr_values, n_start):
+        """Insert rows in the sorted index of a field, if built.
+        The index is marked stale when values are not comparable.
+
+        :param field: indexed field
+        :type field: str
+        :param sr_values: series of field values
+        :type sr_values: :class:`pandas.Series`
+        :param n_start: row position of the first row in the series
+        :type n_start: int
+        :return: None
+        :rtype: None
+        """
+        if self._indexes.get(field) is None:
+            return None
+        vct_sorted, vct_order = self._indexes[field]
+        vct_values = sr_values.values
+        if self._data[field].dtype != vct_sorted.dtype:
+            # column dtype changed
+            self._indexes[field] = None
+            return None
+        vct_pos = np.arange(n_start, n_start + len(vct_values))
+        vct_ok = ~pd.isna(vct_values)
+        vct_values = vct_values[vct_ok]
+        vct_pos = vct_pos[vct_ok]
+        try:
+            vct_new = np.argsort(vct_values, kind="stable")
+            vct_at = np.searchsorted(vct_sorted, vct_values[vct_new], side="right")
+        except TypeError:
+            # unorderable mixed values
+            self._indexes[field] = None
+            return None
+        self._indexes[field] = (
+            np.insert(vct_sorted, vct_at, vct_values[vct_new]),
+            np.insert(vct_order, vct_at, vct_pos[vct_new]),
+        )
+        return None
+
+    def _remove_from_sorted_index(self, field, value, n_pos):
+        """Remove a row from the sorted index of a field, if built.
+
+        :param field: indexed field
+        :type field: str
+        :param value: indexed value of the row
+        :type value: object
+        :param n_pos: row position
+        :type n_pos: int
+        :return: None
+        :rtype: None
+        """
+        if self._indexes.get(field) is None or pd.isna(value):
+            return None
+        vct_sorted, vct_order = self._indexes[field]
+        try:
+            n_lo = np.searchsorted(vct_sorted, value, side="left")
+            n_hi = np.searchsorted(vct_sorted, value, side="right")
+        except TypeError:
+            self._indexes[field] = None
+            return None
+        vct_at = n_lo + np.flatnonzero(vct_order[n_lo:n_hi] == n_pos)
+        if len(vct_at) == 0:
+            # row not found by its value
+            self._indexes[field] = None
+            return None
+        self._indexes[field] = (
+            np.delete(vct_sorted, vct_at[0]),
+            np.delete(vct_order, vct_at[0]),
+        )
+        return None
+
+    def _lookup_index(self, field, value):
+        """Look up the row positions matching a criterion in a secondary index.
+
+        :param field: field name
+        :type field: str
+        :param value: criterion (see :meth:`find`)
+        :type value: object
+        :return: sorted array of row positions or None if not indexed
+        :rtype: :class:`numpy.ndarray` or None
+        """
+        kind = self.columns_data_indexes.get(field)
+        if field not in self._indexes:
+            return None
+        if kind == "hash":
+            if isinstance(value, tuple):
+                return None
+            list_values = value if isinstance(value, (list, set)) else [value]
+            set_pos = set()
+            for v in list_values:
+                set_pos.update(self._indexes[field].get(v, set()))
+            return np.sort(np.fromiter(set_pos, dtype=int, count=len(set_pos)))
+        # sorted index
+        tpl_index = self._get_sorted_index(field=field)
+        if tpl_index is None:
+            return None
+        vct_sorted, vct_order = tpl_index
+        if isinstance(value, tuple):
+            lo, hi = value
+            n_lo = 0 if lo is None else np.searchsorted(vct_sorted, lo, side="left")
+            n_hi = (
+                len(vct_sorted)
+                if hi is None
+                else np.searchsorted(vct_sorted, hi, side="right")
+            )
+            return np.sort(vct_order[n_lo:n_hi])
+        list_values = value if isinstance(value, (list, set)) else [value]
+        list_pos = [
+            vct_order[
+                np.searchsorted(vct_sorted, v, side="left") : np.searchsorted(
+                    vct_sorted, v, side="right"
+                )
+            ]
+            for v in list_values
+        ]
+        return np.unique(np.concatenate(list_pos + [np.array([], dtype=int)]))
+
+    def _build_dates(self, columns=None):
+        """Build the parsed datetime shadow columns of declared date fields.
+
+        :param columns: columns to rebuild. If None, all shadow columns are rebuilt
+        :type columns: list
+        :return: None
+        :rtype: None
+        """
+        if columns is None:
+            self._dates = {}
+        if self._data is not None:
+            if columns is None:
+                columns = list(self.columns_data_dates)
+            for k in columns:
+                if k in self.columns_data_dates and k in self._data.columns:
+                    self._dates[k] = self._get_parsed_dates(
+                        field=k, sr_dates=self._data[k]
+                    )
+        return None
+
+    def _get_parsed_dates(self, field, sr_dates):
+        """Parse the values of a date field with its declared format.
+
+        :param field: date field
+        :type field: str
+        :param sr_dates: series of textual dates
+        :type sr_dates: :class:`pandas.Series`
+        :return: array of datetimes
+        :rtype: :class:`numpy.ndarray`
+        """
+        sr_dates = self._parse_datetime(
+            sr_dates, format=self.columns_data_dates.get(field)
+        )
+        return np.array(sr_dates.values, dtype="datetime64[ns]")
+
+    def get_dates(self, field, df=None):
+        """Get the parsed datetimes of a date field.
+        Declared date fields are taken from the cached shadow columns,
+        so they are not parsed again.
+
+        :param field: date field
+        :type field: str
+        :param df: rows of the data table. If None, it takes the full table.
+        :type df: :class:`pandas.DataFrame`
+        :return: series of datetimes aligned to the rows
+        :rtype: :class:`pandas.Series`
+        """
+        if df is None:
+            df = self.data
+        if field == self.rectimest_field:
+            return df[field]
+        if field in self._dates:
+            if df is self._data:
+                return pd.Series(self._dates[field], index=df.index, name=field)
+            sr_pos = df[self.recid_field].map(self._index)
+            if sr_pos.notna().all():
+                vct_dates = self._dates[field][sr_pos.values.astype(int)]
+                return pd.Series(vct_dates, index=df.index, name=field)
+        # rows off the table
+        vct_dates = self._get_parsed_dates(field=field, sr_dates=df[field])
+        return pd.Series(vct_dates, index=df.index, name=field)
+
+    def _build_last_id(self):
+        """Rebuild the ``RecId`` integer high-water mark from the data table.
+
+        :return: None
+        :rtype: None
+        """
+        if self._data is None or len(self._data) == 0:
+            self._last_id = 0
+        else:
+            n_max = self._parse_recid(self._data[self.recid_field]).max()
+            self._last_id = 0 if pd.isna(n_max) else int(n_max)
+        return None
+
+    def _parse_recid(self, sr_recid):
+        """Parse ``RecId`` strings into integers (vectorized).
+        Ids are handled as a matrix of unicode code points, so the digits
+        are parsed with array arithmetic.
+
+        :param sr_recid: series of record ids
+        :type sr_recid: :class:`pandas.Series`
+        :return: series of record id integers (NaN if not parsable)
+        :rtype: :class:`pandas.Series`
+        """
+        vct_text = np.asarray(sr_recid.astype(str).values, dtype=str)
+        n_prefix = len(self.id_prefix)
+        n_width = max(vct_text.dtype.itemsize // 4, n_prefix + 1)
+        vct_text = vct_text.astype("U{}".format(n_width))
+        mtx_code = vct_text.view(np.uint32).reshape(len(vct_text), n_width)
+        # prefix match and digits region (strings are zero-padded)
+        vct_prefix = np.array([ord(c) for c in self.id_prefix], dtype=np.uint32)
+        vct_ok = (mtx_code[:, :n_prefix] == vct_prefix).all(axis=1)
+        mtx_digits = mtx_code[:, n_prefix:].astype(np.int64) - ord("0")
+        vct_len = (mtx_code[:, n_prefix:] != 0).sum(axis=1)
+        mtx_in = np.arange(n_width - n_prefix) < vct_len[:, None]
+        vct_ok = vct_ok & (vct_len > 0)
+        vct_ok = vct_ok & ((mtx_digits >= 0) & (mtx_digits <= 9) | ~mtx_in).all(axis=1)
+        # positional powers of ten
+        mtx_exp = vct_len[:, None] - 1 - np.arange(n_width - n_prefix)
+        mtx_values = np.where(mtx_in, mtx_digits * 10 ** np.maximum(mtx_exp, 0), 0)
+        vct_ids = np.where(vct_ok, mtx_values.sum(axis=1), np.nan)
+        return pd.Series(vct_ids, index=sr_recid.index)
+
+    def _make_recid(self, id_int):
+        """Make a record id string from an integer.
+
+        :param id_int: record id integer
+        :type id_int: int
+        :return: record id
+        :rtype: str
+        """
+        return self.id_prefix + str(id_int).zfill(self.id_size)
+
+    def _make_recids(self, vct_ints):
+        """Make record id strings from an array of integers (vectorized).
+        Digits are written as unicode code points for each id width.
+
+        :param vct_ints: record id integers
+        :type vct_ints: :class:`numpy.ndarray`
+        :return: record ids
+        :rtype: :class:`numpy.ndarray`
+        """
+        vct_ints = np.asarray(vct_ints, dtype=np.int64)
+        vct_ids = np.empty(len(vct_ints), dtype=object)
+        vct_prefix = np.array([ord(c) for c in self.id_prefix], dtype=np.uint32)
+        # width of each id (at least id_size)
+        vct_digits = np.floor(np.log10(np.maximum(vct_ints, 1))).astype(int) + 1
+        vct_size = np.maximum(vct_digits, self.id_size)
+        for n_size in np.unique(vct_size):
+            vct_mask = vct_size == n_size
+            vct_exp = 10 ** np.arange(n_size - 1, -1, -1, dtype=np.int64)
+            mtx_code = (vct_ints[vct_mask, None] // vct_exp) % 10 + ord("0")
+            mtx_code = np.hstack(
+                [np.tile(vct_prefix, (len(mtx_code), 1)), mtx_code.astype(np.uint32)]
+            )
+            vct_text = mtx_code.view("U{}".format(mtx_code.shape[1])).ravel()
+            vct_ids[vct_mask] = vct_text.astype(object)
+        return vct_ids
+
+    def _get_position(self, rec_id):
+        """Get the row position of a record in the data table.
+
+        :param rec_id: record id
+        :type rec_id: str
+        :return: row position
+        :rtype: int
+        """
+        self._load_lazy()
+        # materialize pending records
+        if self._buffer:
+            self.flush()
+        if rec_id not in self._index:
+            raise KeyError(rec_id)
+        return self._index[rec_id]
+
+    def _get_positions(self, rec_ids):
+        """Get the row positions of many records in the data table.
+
+        :param rec_ids: record ids
+        :type rec_ids: list
+        :return: row positions
+        :rtype: :class:`numpy.ndarray`
+        """
+        self._load_lazy()
+        # materialize pending records
+        if self._buffer:
+            self.flush()
+        vct_pos = np.array([self._index.get(r, -1) for r in rec_ids], dtype=int)
+        if (vct_pos < 0).any():
+            raise KeyError([r for r, n in zip(rec_ids, vct_pos) if n < 0])
+        return vct_pos
+
     def _get_organized_columns(self):
         """Return the organized columns (base + data columns)
 
@@ -252,27 +1036,59 @@ class RecordTable(DataSet):
         _now = datetime.datetime.now()
         return str(_now.strftime("%Y-%m-%d %H:%M:%S"))
 
+    @staticmethod
+    def get_datetime():
+        """Return the current datetime truncated to seconds
+
+        :return: current datetime
+        :rtype: :class:`datetime.datetime`
+        """
+        return datetime.datetime.now().replace(microsecond=0)
+
     def _last_id_int(self):
-        """Compute the last ID integer in the record data table.
+        """Get the last ID integer in the record data table.
 
         :return: last Id integer from the record data table.
         :rtype: int
         """
-        if self.data is None:
-            return 0
-        else:
-            df = self.data.sort_values(by=self.recid_field, ascending=True)
-            return int(df[self.recid_field].values[-1].replace("Rec", ""))
+        self._load_lazy()
+        return self._last_id
 
     def _next_recid(self):
-        """Get the next record id string based on the existing ids.
+        """Allocate the next record id string from the id high-water mark.
 
         :return: next record id
         :rtype: str
         """
-        last_id_int = self._last_id_int()
-        next_id = "Rec" + str(last_id_int + 1).zfill(self.id_size)
-        return next_id
+        self._load_lazy()
+        self._last_id = self._last_id + 1
+        return self._make_recid(id_int=self._last_id)
+
+    def _make_record(self, dict_rec, rec_id, timestamp):
+        """Make a new record dictionary with the default base fields.
+
+        :param dict_rec: input record dictionary
+        :type dict_rec: dict
+        :param rec_id: record id
+        :type rec_id: str
+        :param timestamp: record timestamp
+        :type timestamp: :class:`datetime.datetime`
+        :return: new record dictionary
+        :rtype: dict
+        """
+        # ------ parse expected fields ------- #
+        # filter expected columns
+        dict_rec_filter = self._filter_dict_rec(input_dict=dict_rec)
+        # ------ set default fields ------- #
+        # set table field
+        dict_rec_filter[self.rectable_field] = self.name
+        # create index
+        dict_rec_filter[self.recid_field] = rec_id
+        # compute timestamp
+        dict_rec_filter[self.rectimest_field] = timestamp
+        # set active
+        dict_rec_filter[self.recstatus_field] = True
+        return dict_rec_filter
 
     def _filter_dict_rec(self, input_dict):
         """Filter input record dictionary based on the expected table data columns.
@@ -290,6 +1106,273 @@ class RecordTable(DataSet):
                 dict_rec_filter[k] = input_dict[k]
         return dict_rec_filter
 
+    def _get_file_journal(self, file_data=None):
+        """Get the journal file path, next to the data file.
+
+        :param file_data: file path to data. If None, it takes ``file_data``.
+        :type file_data: str
+        :return: file path to journal
+        :rtype: str
+        """
+        if file_data is None:
+            file_data = self.file_data
+        return os.path.splitext(file_data)[0] + "_journal.csv"
+
+    def _log_change(self, op, rec_id, dict_rec, dict_old=None):
+        """Log a record operation to the pending journal and history.
+
+        :param op: operation name (``insert``, ``edit`` or ``archive``)
+        :type op: str
+        :param rec_id: record id
+        :type rec_id: str
+        :param dict_rec: record dictionary with changed fields
+        :type dict_rec: dict
+        :param dict_old: record dictionary with previous values of changed
+            fields (the history delta)
+        :type dict_old: dict
+        :return: None
+        :rtype: None
+        """
+        if self.journal:
+            self._journal.append(
+                {
+                    "Op": op,
+                    "RecId": rec_id,
+                    "Timestamp": self.get_timestamp(),
+                    "Payload": json.dumps(dict_rec, default=self._to_json_value),
+                }
+            )
+        if self.history:
+            timestamp = dict_rec.get(self.rectimest_field, self.get_datetime())
+            dict_entry = {
+                "Op": op,
+                "RecId": rec_id,
+                "Timestamp": timestamp.strftime(self.timestamp_format),
+                "Payload": json.dumps(dict_old or {}, default=self._to_json_value),
+            }
+            self._history.append(dict_entry)
+            if self._history_index is not None:
+                self._add_to_history_index(entries=[dict_entry])
+        return None
+
+    def _get_file_history(self, file_data=None):
+        """Get the version history file path, next to the data file.
+
+        :param file_data: file path to data. If None, it takes ``file_data``.
+        :type file_data: str
+        :return: file path to version history
+        :rtype: str
+        """
+        if file_data is None:
+            file_data = self.file_data
+        return os.path.splitext(file_data)[0] + "_history.csv"
+
+    def _append_history(self):
+        """Append the pending history entries to the version history file.
+
+        :return: None
+        :rtype: None
+        """
+        if len(self._history) == 0 or self.file_data is None:
+            return None
+        file_history = self._get_file_history()
+        pd.DataFrame(self._history).to_csv(
+            file_history,
+            sep=self.file_data_sep,
+            index=False,
+            mode="a",
+            header=not os.path.isfile(file_history),
+        )
+        self._history = []
+        return None
+
+    def _build_history_index(self):
+        """Build the version history index, mapping each ``RecId`` to its
+        chain of history entries, from the version history file and the
+        pending entries. The file is read once per data file.
+
+        :return: None
+        :rtype: None
+        """
+        self._history_index = {}
+        self._history_index_file = self.file_data
+        if self.file_data is not None and os.path.isfile(self._get_file_history()):
+            df = pd.read_csv(
+                self._get_file_history(),
+                sep=self.file_data_sep,
+                dtype=str,
+                keep_default_na=False,
+            )
+            self._add_to_history_index(entries=df.to_dict(orient="records"))
+        self._add_to_history_index(entries=self._history)
+        return None
+
+    def _add_to_history_index(self, entries):
+        """Add history entries to the chains of their records, in logging order.
+
+        :param entries: history entry dictionaries
+        :type entries: list
+        :return: None
+        :rtype: None
+        """
+        if len(entries) == 0:
+            return None
+        sr_timest = pd.to_datetime(
+            pd.Series([e["Timestamp"] for e in entries]), format=self.timestamp_format
+        )
+        for dict_entry, timest in zip(entries, sr_timest):
+            if dict_entry["RecId"] not in self._history_index:
+                self._history_index[dict_entry["RecId"]] = []
+            self._history_index[dict_entry["RecId"]].append(
+                (dict_entry["Op"], timest, dict_entry["Payload"])
+            )
+        return None
+
+    def _get_history(self, timestamp, rec_ids=None):
+        """Get the history entries logged after a timestamp, in logging order
+        by record. Only the chains of the requested records are read.
+
+        :param timestamp: timestamp
+        :type timestamp: :class:`pandas.Timestamp`
+        :param rec_ids: record ids to filter. If None, it takes all records.
+        :type rec_ids: list
+        :return: history entries
+        :rtype: :class:`pandas.DataFrame`
+        """
+        if (
+            self._history_index is None
+            or self._history_index_file != self.file_data
+        ):
+            self._build_history_index()
+        if rec_ids is None:
+            rec_ids = list(self._history_index)
+        list_entries = [
+            (op, rec_id, timest, payload)
+            for rec_id in rec_ids
+            for op, timest, payload in self._history_index.get(rec_id, [])
+            if timest > timestamp
+        ]
+        return pd.DataFrame(
+            list_entries, columns=["Op", "RecId", "Timestamp", "Payload"]
+        )
+
+    def _get_data_as_of(self, df, timestamp):
+        """Reconstruct rows of the data table as of a timestamp, undoing the
+        history deltas logged after it.
+
+        :param df: rows of the data table
+        :type df: :class:`pandas.DataFrame`
+        :param timestamp: timestamp
+        :type timestamp: str or :class:`datetime.datetime`
+        :return: rows as of the timestamp
+        :rtype: :class:`pandas.DataFrame`
+        """
+        timestamp = pd.Timestamp(timestamp)
+        rec_ids = None if df is self._data else df[self.recid_field].values
+        df_history = self._get_history(timestamp=timestamp, rec_ids=rec_ids)
+        # the first delta after the timestamp holds the value as of it
+        dict_values = {}
+        set_inserted = set()
+        for op, rec_id, payload in zip(
+            df_history["Op"], df_history["RecId"], df_history["Payload"]
+        ):
+            if op == "insert":
+                set_inserted.add(rec_id)
+            for k, value in json.loads(payload).items():
+                if k not in dict_values:
+                    dict_values[k] = {}
+                dict_values[k].setdefault(rec_id, value)
+        # restore values
+        df = df.copy()
+        sr_pos = pd.Series(np.arange(len(df)), index=df[self.recid_field].values)
+        for k in dict_values:
+            if k not in df.columns:
+                continue
+            vct_pos = sr_pos[list(dict_values[k])].values
+            list_values = list(dict_values[k].values())
+            if k == self.rectimest_field:
+                list_values = pd.to_datetime(list_values)
+            df.iloc[vct_pos, df.columns.get_loc(k)] = list_values
+        # drop records inserted later
+        df = df[~df[self.recid_field].isin(set_inserted)]
+        return self._prepare_data(df)
+
+    def data_as_of(self, timestamp):
+        """Get the data table as of a timestamp, from the version history.
+        Changes that are not journaled (bulk sets and merges) are not
+        tracked.
+
+        :param timestamp: timestamp
+        :type timestamp: str or :class:`datetime.datetime`
+        :return: data table as of the timestamp
+        :rtype: :class:`pandas.DataFrame`
+        """
+        return self._get_data_as_of(df=self.data, timestamp=timestamp)
+
+    def _append_journal(self):
+        """Append the pending operations to the journal file.
+
+        :return: None
+        :rtype: None
+        """
+        if len(self._journal) == 0:
+            return None
+        file_journal = self._get_file_journal()
+        df = pd.DataFrame(self._journal)
+        df.to_csv(
+            file_journal,
+            sep=self.file_data_sep,
+            index=False,
+            mode="a",
+            header=not os.path.isfile(file_journal),
+        )
+        self._journal_size = self._journal_size + len(self._journal)
+        self._journal = []
+        return None
+
+    def _replay_journal(self, file_journal):
+        """Replay the operations of a journal file on the data table.
+
+        :param file_journal: file path to journal
+        :type file_journal: str
+        :return: number of replayed operations
+        :rtype: int
+        """
+        df = pd.read_csv(
+            file_journal, sep=self.file_data_sep, dtype=str, keep_default_na=False
+        )
+        for op, rec_id, payload in zip(df["Op"], df["RecId"], df["Payload"]):
+            dict_rec = json.loads(payload)
+            if self.rectimest_field in dict_rec:
+                dict_rec[self.rectimest_field] = pd.Timestamp(
+                    dict_rec[self.rectimest_field]
+                )
+            if op == "insert":
+                self._buffer.append(dict_rec)
+            else:
+                self._set_record_values(rec_id=rec_id, dict_rec=dict_rec)
+        # materialize and restore id counter
+        self.flush()
+        self._build_last_id()
+        return len(df)
+
+    @staticmethod
+    def _to_json_value(value):
+        """Util static method for converting non-builtin values to json
+
+        :param value: incoming value (numpy scalar, timestamp, etc)
+        :type value: object
+        :return: json-compatible value
+        :rtype: object
+        """
+        if isinstance(value, np.datetime64):
+            value = pd.Timestamp(value)
+        if isinstance(value, datetime.datetime):
+            return str(value)
+        if hasattr(value, "item"):
+            return value.item()
+        return str(value)
+
     def update(self):
         super().update()
         # ... continues in downstream objects ... #
@@ -297,6 +1380,33 @@ class RecordTable(DataSet):
 
     def save(self):
         """Save the data to the sourced file data.
+        If ``journal`` is True, only the record operations since the last save
+        are appended to the journal file, which is compacted once it exceeds
+        ``journal_max`` operations.
+
+        .. danger::
+
+            This method may **overwrite** the sourced data file.
+
+
+        :return: integer denoting succesfull save (0) or file not found (1)
+        :rtype: int
+        """
+        if self.file_data is None:
+            return 1
+        self._append_history()
+        if self.journal and self._journal_synced and os.path.isfile(self.file_data):
+            self._append_journal()
+            self._version_saved = self._version
+            if self._journal_size > self.journal_max:
+                self.compact()
+            return 0
+        else:
+            return self.compact()
+
+    def compact(self):
+        """Compact the journal into the sourced file data, that is, rewrite
+        the full table and remove the journal file.
 
         .. danger::
 
@@ -307,17 +1417,27 @@ class RecordTable(DataSet):
         :rtype: int
         """
         if self.file_data is not None:
-            # handle filename
-            filename = os.path.basename(self.file_data).split(".")[0]
-            # handle folder
-            self.export(
-                folder_export=os.path.dirname(self.file_data), filename=filename
-            )
+            # write to exactly the sourced file (the journal belongs to it)
+            file_format = self._get_file_format(file_path=self.file_data)
+            df = self.data[self._get_organized_columns()]
+            self.storage[file_format]["write"](df, self.file_data)
+            self._set_sidecar(file_data=self.file_data, size=len(df))
+            self._append_history()
+            # reset journal
+            file_journal = self._get_file_journal()
+            if os.path.isfile(file_journal):
+                os.remove(file_journal)
+            self._journal = []
+            self._journal_size = 0
+            self._journal_synced = True
+            self._version_saved = self._version
             return 0
         else:
             return 1
 
-    def export(self, folder_export=None, filename=None, filter_archive=False):
+    def export(
+        self, folder_export=None, filename=None, filter_archive=False, file_format=None
+    ):
         """Export the ``RecordTable`` data.
 
         :param folder_export: folder to export
@@ -326,13 +1446,18 @@ class RecordTable(DataSet):
         :type filename: str
         :param filter_archive: option for exporting only records with ``RecStatus`` = ``On``
         :type filter_archive: bool
+        :param file_format: storage format (``csv``, ``parquet`` or ``feather``).
+            If None, it takes the ``file_data_format`` attribute.
+        :type file_format: str
         :return: file path is export is successfull (1 otherwise)
         :rtype: str or int
         """
         if filename is None:
             filename = self.name
+        if file_format is None:
+            file_format = self.file_data_format
         # append extension
-        filename = filename + ".csv"
+        filename = filename + self.storage[file_format]["extension"]
         if self.data is not None:
             # handle folders
             if folder_export is not None:
@@ -341,12 +1466,12 @@ class RecordTable(DataSet):
                 filepath = os.path.join(self.folder_data, filename)
             # handle archived records
             if filter_archive:
-                df = self.data.query("RecStatus == 'On'")
+                df = self.find(**{self.recstatus_field: True})
             else:
                 df = self.data.copy()
             # filter default columns:
             df = df[self._get_organized_columns()]
-            df.to_csv(filepath, sep=self.file_data_sep, index=False)
+            self.storage[file_format]["write"](df, filepath)
             return filepath
         else:
             return 1
@@ -370,49 +1495,403 @@ class RecordTable(DataSet):
 
         # -------------- set data logic here -------------- #
         if load_data:
-            self.load_data(file_data=self.file_data)
-            self.refresh_data()
+            if self.lazy:
+                self._set_lazy(file_data=self.file_data)
+            else:
+                self.load_data(file_data=self.file_data)
+                self.refresh_data()
 
         # -------------- update other mutables -------------- #
         self.update()
 
         # ... continues in downstream objects ... #
 
+    def _load_lazy(self):
+        """Load the data pending for lazy loading, if any.
+        Expected to increment superior methods.
+
+        :return: None
+        :rtype: None
+        """
+        if self._file_lazy is not None:
+            super()._load_lazy()
+            self.refresh_data()
+        return None
+
+    def unload(self):
+        """Release the data from memory. It is loaded again from file on
+        next access. Tables with unsaved changes are not released
+        (call :meth:`save` first), so the data file is never written here.
+        Expected to increment superior methods.
+
+        :return: None
+        :rtype: None
+        """
+        if self._file_lazy is None:
+            # materialize pending records, so they count as changes
+            self.flush()
+            if self._version != self._version_saved:
+                raise RuntimeError(
+                    "Unsaved changes in {}: call save() before unload()".format(
+                        self.name
+                    )
+                )
+        super().unload()
+        return None
+
+    def _set_sidecar(self, file_data, size):
+        """Write the metadata sidecar of a csv data file. Other storage
+        formats hold their own metadata.
+
+        :param file_data: file path to data.
+        :type file_data: str
+        :param size: data size (rows) in file
+        :type size: int
+        :return: None
+        :rtype: None
+        """
+        if self._get_file_format(file_path=file_data) == "csv":
+            self._write_sidecar(file_data=file_data, size=size)
+        return None
+
+    def _get_file_last_id(self, file_data):
+        """Get the ``RecId`` integer high-water mark of a file without loading
+        the data, reading only the ``RecId`` column of the file and journal.
+
+        :param file_data: file path to data.
+        :type file_data: str
+        :return: last Id integer in file
+        :rtype: int
+        """
+        if not os.path.isfile(file_data):
+            return 0
+        file_format = self._get_file_format(file_path=file_data)
+        list_ids = [
+            self.storage[file_format]["read"](file_data, columns=[self.recid_field])
+        ]
+        file_journal = self._get_file_journal(file_data=file_data)
+        if os.path.isfile(file_journal):
+            list_ids.append(
+                pd.read_csv(
+                    file_journal, sep=self.file_data_sep, usecols=[self.recid_field]
+                )
+            )
+        sr_ids = pd.concat(list_ids, ignore_index=True)[self.recid_field]
+        n_max = self._parse_recid(sr_ids).max() if len(sr_ids) > 0 else np.nan
+        return 0 if pd.isna(n_max) else int(n_max)
+
+    def _get_file_size(self, file_data):
+        """Get the data size (rows) of a file without loading the data,
+        from the storage metadata and the journal inserts.
+        Expected to overwrite superior methods.
+
+        :param file_data: file path to data.
+        :type file_data: str
+        :return: data size or None if unknown
+        :rtype: int or None
+        """
+        if not os.path.isfile(file_data):
+            return None
+        file_format = self._get_file_format(file_path=file_data)
+        n_size = self.storage[file_format]["size"](file_data)
+        file_journal = self._get_file_journal(file_data=file_data)
+        if n_size is not None and os.path.isfile(file_journal):
+            df = pd.read_csv(file_journal, sep=self.file_data_sep, usecols=["Op"])
+            n_size = n_size + int((df["Op"] == "insert").sum())
+        return n_size
+
     def refresh_data(self):
         """Refresh data method for the object operator.
         Performs spreadsheet-like formulas for columns.
 
+        Operator columns are computed in dependency order, and only when
+        their input columns changed since the last refresh. Row-wise columns
+        are computed only on rows changed since the last refresh.
+        Time-dependent columns are always computed on the full table.
+
         :return: None
         :rtype: None
         """
+        # materialize pending records
+        self.flush()
+        # recomputed columns are not unsaved changes
+        is_saved = self._version == self._version_saved
         if self.operator is not None:
-            for c in self.operator:
-                self.data[c] = self.operator[c]()
+            set_changed = self._changed_columns
+            set_dirty = self._dirty_rows
+            list_refreshed = []
+            for c in self._get_operator_order():
+                dict_op = self._get_operator_spec(column=c)
+                if not (
+                    set_changed is None
+                    or dict_op["inputs"] is None
+                    or dict_op["time"]
+                    or c not in self._data.columns
+                    or not set_changed.isdisjoint(dict_op["inputs"])
+                ):
+                    continue
+                if (
+                    set_dirty is None
+                    or dict_op["time"]
+                    or not dict_op["rowwise"]
+                    or c not in self._data.columns
+                ):
+                    # full recompute
+                    self._data[c] = dict_op["func"](self._data)
+                elif len(set_dirty) > 0:
+                    # recompute dirty rows only
+                    vct_rows = np.fromiter(set_dirty, dtype=int)
+                    vct_values = dict_op["func"](self._data.iloc[vct_rows])
+                    n_col = self._data.columns.get_loc(c)
+                    self._data.iloc[vct_rows, n_col] = np.asarray(vct_values)
+                list_refreshed.append(c)
+                # propagate to dependent columns
+                if set_changed is not None:
+                    set_changed.add(c)
+            self._changed_columns = set()
+            self._dirty_rows = set()
+            self._on_refresh(columns=list_refreshed)
+        if is_saved:
+            self._version_saved = self._version
         # update object
         self.update()
 
-    def load_data(self, file_data):
+    def _get_operator_spec(self, column):
+        """Get the normalized operator spec of a column.
+        Plain callables (without arguments) are handled as columns without
+        declared inputs, which are always computed.
+
+        :param column: operator column
+        :type column: str
+        :return: dictionary with ``inputs``, ``time``, ``rowwise`` and ``func``
+        :rtype: dict
+        """
+        operator = self.operator[column]
+        if callable(operator):
+            return {
+                "inputs": None,
+                "time": False,
+                "rowwise": False,
+                "func": lambda df: operator(),
+            }
+        return {
+            "inputs": operator.get("inputs"),
+            "time": operator.get("time", False),
+            "rowwise": operator.get("rowwise", True),
+            "func": operator["func"],
+        }
+
+    def _get_operator_order(self):
+        """Get the operator columns in dependency (topological) order.
+
+        :return: ordered operator columns
+        :rtype: list
+        """
+        # dependencies among operator columns (self-references ignored)
+        dict_deps = {}
+        for c in self.operator:
+            list_inputs = self._get_operator_spec(column=c)["inputs"] or []
+            dict_deps[c] = {i for i in list_inputs if i in self.operator and i != c}
+        list_order = []
+        while len(list_order) < len(dict_deps):
+            list_ready = [
+                c
+                for c in dict_deps
+                if c not in list_order and dict_deps[c] <= set(list_order)
+            ]
+            if len(list_ready) == 0:
+                raise ValueError("Cyclic operator dependencies")
+            list_order = list_order + list_ready
+        return list_order
+
+    def load_data(self, file_data, upsert=False, content_hash=False):
         """Load data from file.
         Expected to overwrite superior methods.
 
         :param file_data: file path to data.
         :type file_data: str
+        :param upsert: option for merging the file records by ``RecId``
+            (see :meth:`merge_data`) instead of appending them. Default False
+        :type upsert: bool
+        :param content_hash: option for replacing known records with changed
+            content when merging. Default False
+        :type content_hash: bool
         :return: None
         :rtype: None
         """
+        # pending lazy data comes first
+        self._load_lazy()
         # -------------- overwrite relative path input -------------- #
         self.file_data = os.path.abspath(file_data)
         # -------------- implement loading logic -------------- #
+        file_format = self._get_file_format(file_path=self.file_data)
+        # loading on empty table matches the file
+        is_empty = self._data is None or len(self.data) == 0
+        file_journal = self._get_file_journal()
 
         # -------------- call loading function -------------- #
-        df = pd.read_csv(self.file_data, sep=self.file_data_sep)
+        if upsert and not is_empty and os.path.isfile(file_journal):
+            # the file state needs its journal replayed apart
+            rt = self._get_scratch_table()
+            rt.load_data(file_data=self.file_data)
+            df = rt.data
+        else:
+            df = self.storage[file_format]["read"](self.file_data)
 
         # -------------- post-loading logic -------------- #
-        self.set_data(input_df=df)
+        if upsert and not is_empty:
+            self.merge_data(input_df=df, content_hash=content_hash)
+            self._journal_size = 0
+        else:
+            if self.lazy:
+                # cache size for the next lazy boot
+                self._set_sidecar(file_data=self.file_data, size=len(df))
+            self.set_data(input_df=df)
+            # replay journal
+            if os.path.isfile(file_journal):
+                self._journal_size = self._replay_journal(file_journal=file_journal)
+            else:
+                self._journal_size = 0
+        self._journal = []
+        self._journal_synced = is_empty
+        if is_empty:
+            self._version_saved = self._version
+
+        return None
+
+    def _get_scratch_table(self):
+        """Get an empty table with the same schema and storage settings.
 
+        :return: empty record table
+        :rtype: :class:`RecordTable`
+        """
+        rt = type(self)(name=self.name, alias=self.alias)
+        list_attrs = ["file_data_format", "file_data_sep", "id_prefix", "id_size"]
+        for attr, value in vars(self).items():
+            if attr.startswith("columns_data") or attr in list_attrs:
+                setattr(rt, attr, value)
+        return rt
+
+    def load_many(self, files_data, workers=None):
+        """Load data from many files at once.
+        Files are read and normalized by the ``set_data`` rules in a thread
+        pool, with ``RecId`` ranges allocated up front in files order, and
+        the table is concatenated and indexed once.
+
+        :param files_data: file paths to data
+        :type files_data: list
+        :param workers: number of threads. If None, it takes the default of
+            :class:`concurrent.futures.ThreadPoolExecutor`
+        :type workers: int
+        :return: None
+        :rtype: None
+        """
+        files_data = [os.path.abspath(f) for f in files_data]
+        if len(files_data) == 0:
+            return None
+        # pending lazy data comes first
+        self._load_lazy()
+        # loading on empty table matches a single file
+        is_empty = self._data is None or len(self.data) == 0
+
+        def func_read(file_data):
+            file_format = self._get_file_format(file_path=file_data)
+            return self.storage[file_format]["read"](file_data)
+
+        def func_normalize(df, n_start_id):
+            return self._normalize_data(input_df=df, n_start_id=n_start_id)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # -------------- call loading function -------------- #
+            list_dfs = list(executor.map(func_read, files_data))
+            # allocate RecId ranges for files without ids,
+            # above the ids carried by any file in the batch
+            n_last_id = self._last_id_int()
+            for df in list_dfs:
+                if self.recid_field in df.columns and len(df) > 0:
+                    n_max = self._parse_recid(df[self.recid_field]).max()
+                    if not pd.isna(n_max):
+                        n_last_id = max(n_last_id, int(n_max))
+            list_starts = []
+            n_start_id = n_last_id + 1
+            for df in list_dfs:
+                list_starts.append(n_start_id)
+                if self.recid_field not in df.columns:
+                    n_start_id = n_start_id + len(df)
+            # -------------- post-loading logic -------------- #
+            list_dfs = list(executor.map(func_normalize, list_dfs, list_starts))
+
+        # concatenate once
+        df = pd.concat(list_dfs, ignore_index=True)
+        df = df.drop_duplicates(subset=self.recid_field, ignore_index=True)
+        if self._data is not None:
+            df = pd.concat([self.data, df], ignore_index=True)
+        self.data = df
+
+        # replay journals in files order
+        self._journal_size = 0
+        for file_data in files_data:
+            file_journal = self._get_file_journal(file_data=file_data)
+            if os.path.isfile(file_journal):
+                self._journal_size = self._journal_size + self._replay_journal(
+                    file_journal=file_journal
+                )
+        self.file_data = files_data[-1]
+        self._journal = []
+        self._journal_synced = is_empty and len(files_data) == 1
+        if self._journal_synced:
+            self._version_saved = self._version
+        self.update()
         return None
 
-    def set_data(self, input_df, append=True, inplace=True):
+    def iter_data(self, file_data=None, chunksize=None):
+        """Iterate over normalized data chunks from file, without loading
+        the full table. Each chunk is normalized by :meth:`set_data` rules.
+
+        .. note::
+
+            Journal operations are not replayed and the table data is not
+            changed.
+
+
+        :param file_data: file path to data. If None, it takes ``file_data``.
+        :type file_data: str
+        :param chunksize: number of rows per chunk. If None, it takes ``chunksize``.
+        :type chunksize: int
+        :return: generator of data chunks
+        :rtype: generator
+        """
+        if file_data is None:
+            file_data = self.file_data
+        if chunksize is None:
+            chunksize = self.chunksize
+        file_format = self._get_file_format(file_path=file_data)
+        # ids are allocated across chunks by a local counter
+        if self._file_lazy is None:
+            n_last_id = self._last_id
+        else:
+            # lazy data is not loaded, only its ids are read
+            n_last_id = self._get_file_last_id(file_data=self._file_lazy)
+        for df in self.storage[file_format]["iter"](file_data, chunksize):
+            df = self._normalize_data(input_df=df, n_start_id=n_last_id + 1)
+            n_max = self._parse_recid(df[self.recid_field]).max()
+            if not pd.isna(n_max):
+                n_last_id = max(n_last_id, int(n_max))
+            yield df
+
+    def _prepare_data(self, input_df):
+        """Prepare incoming normalized data before it is merged to the table.
+        Base method. Expected to be incremented downstream.
+
+        :param input_df: incoming dataframe
+        :type input_df: dataframe
+        :return: prepared dataframe
+        :rtype: dataframe
+        """
+        # ... continues in downstream objects ... #
+        return input_df
+
+    def set_data(self, input_df, append=True, inplace=True, copy=True):
         """Set RecordTable data from incoming dataframe.
         It handles if the dataframe has or not the required RT columns
         Base Method. Expected to be incremented downstream.
@@ -426,51 +1905,165 @@ class RecordTable(DataSet):
         :param inplace: option for overwrite data. Else return dataframe. Default True
         :type inplace: bool
 
+        :param copy: option for copying the incoming data. If False, the table
+            adopts the incoming columns without copying, so later edits may
+            be seen in the incoming dataframe. Default True
+        :type copy: bool
+
         :return: None
         :rtype: None
         """
+        df_merged = self._normalize_data(input_df=input_df, copy=copy)
+
+        # concatenate dataframes
+        if append:
+            if self.data is not None:
+                df_merged = pd.concat([self.data, df_merged], ignore_index=True)
+
+        if inplace:
+            self.data = df_merged
+            return None
+        else:
+            return df_merged
+
+    def _normalize_data(self, input_df, n_start_id=None, copy=True):
+        """Normalize incoming dataframe by the ``set_data`` rules, without
+        changing the table.
+
+        :param input_df: incoming dataframe
+        :type input_df: dataframe
+        :param n_start_id: first ``RecId`` integer for records without id.
+            If None, it takes the next id of the table.
+        :type n_start_id: int
+        :param copy: option for copying the incoming data. Default True
+        :type copy: bool
+        :return: normalized dataframe
+        :rtype: dataframe
+        """
         list_input_cols = list(input_df.columns)
+        n_size = len(input_df)
+
+        # organize columns at once (missing columns are blank)
+        dict_columns = {
+            c: (
+                input_df[c].array.copy() if copy else input_df[c].array
+            )
+            if c in list_input_cols
+            else np.full(n_size, "", dtype=object)
+            for c in self._get_organized_columns()
+        }
+        # columns are not consolidated into blocks (no extra copy)
+        df_merged = pd.DataFrame(dict_columns, copy=False)
 
         # overwrite RecTable column
-        input_df[self.rectable_field] = self.name
+        df_merged[self.rectable_field] = pd.Categorical.from_codes(
+            np.zeros(n_size, dtype=np.int8), categories=[self.name]
+        )
 
         # handle RecId
         if self.recid_field not in list_input_cols:
-            # enforce Id based on index
-            n_last_id = self._last_id_int()
-            n_incr = n_last_id + 1
-            input_df[self.recid_field] = [
-                "Rec" + str(_ + n_incr).zfill(self.id_size) for _ in input_df.index
-            ]
-        else:
+            # enforce Id from the high-water mark
+            if n_start_id is None:
+                n_start_id = self._last_id_int() + 1
+            df_merged[self.recid_field] = self._make_recids(
+                vct_ints=np.arange(n_start_id, n_start_id + n_size)
+            )
+        elif df_merged[self.recid_field].duplicated().any():
             # remove incoming duplicates
-            input_df.drop_duplicates(subset=self.recid_field, inplace=True)
+            df_merged = df_merged.drop_duplicates(
+                subset=self.recid_field, ignore_index=True
+            )
 
         # handle timestamp
         if self.rectimest_field not in list_input_cols:
-            input_df[self.rectimest_field] = self._get_timestamp()
+            df_merged[self.rectimest_field] = pd.Timestamp(self.get_datetime())
 
-        # handle timestamp
+        # handle status
         if self.recstatus_field not in list_input_cols:
-            input_df[self.recstatus_field] = "On"
+            df_merged[self.recstatus_field] = True
 
-        # Add missing columns with default values
-        for column in self._get_organized_columns():
-            if column not in input_df.columns:
-                input_df[column] = ""
-        df_merged = input_df[self._get_organized_columns()]
+        df_merged = self._set_base_dtypes(df_merged)
+        df_merged = self._prepare_data(df_merged)
+        return df_merged
 
-        # concatenate dataframes
-        if append:
-            if self.data is not None:
-                df_merged = pd.concat([self.data, df_merged], ignore_index=True)
+    def _get_content_hash(self, df):
+        """Get the hash of record contents (data columns and ``RecStatus``).
+        Values are hashed in textual form, with blanks as missing values.
 
-        if inplace:
-            # pass copy
-            self.data = df_merged.copy()
-            return None
-        else:
-            return df_merged
+        :param df: data table rows
+        :type df: :class:`pandas.DataFrame`
+        :return: array of row hashes
+        :rtype: :class:`numpy.ndarray`
+        """
+        df = df[self.columns_data + [self.recstatus_field]]
+        df = df.mask(df == "").astype(str)
+        return pd.util.hash_pandas_object(df, index=False).values
+
+    def merge_data(self, input_df, content_hash=False):
+        """Merge (upsert) incoming dataframe into data by ``RecId``.
+        Records with new ids are appended and records with known ids are
+        skipped, so repeated imports of overlapping data are idempotent.
+
+        :param input_df: incoming dataframe
+        :type input_df: dataframe
+        :param content_hash: option for replacing known records when the
+            hash of their content (data columns and ``RecStatus``) changed.
+            Default False
+        :type content_hash: bool
+        :return: number of inserted and updated records
+        :rtype: dict
+        """
+        dict_merge = {"Inserted": 0, "Updated": 0}
+        if self.data is None:
+            self.set_data(input_df=input_df, append=False)
+            dict_merge["Inserted"] = len(self._data)
+            return dict_merge
+        df = self.set_data(input_df=input_df, append=False, inplace=False)
+        # keep table dtypes
+        for k in df.columns:
+            if df[k].dtype != self._data[k].dtype:
+                try:
+                    df[k] = df[k].astype(self._data[k].dtype)
+                except (ValueError, TypeError):
+                    pass
+        vct_pos = np.array(
+            [self._index.get(r, -1) for r in df[self.recid_field].values], dtype=int
+        )
+        vct_new = vct_pos < 0
+
+        # ------ update changed records ------- #
+        if content_hash and not vct_new.all():
+            df_known = df[~vct_new]
+            vct_hash_in = self._get_content_hash(df=df_known)
+            vct_hash_data = self._get_content_hash(
+                df=self._data.iloc[vct_pos[~vct_new]]
+            )
+            df_changed = df_known[vct_hash_in != vct_hash_data]
+            if len(df_changed) > 0:
+                vct_ids = df_changed[self.recid_field].values
+                dict_values = {
+                    k: (vct_ids, df_changed[k].values)
+                    for k in df_changed.columns
+                    if k not in [self.recid_field, self.rectable_field]
+                }
+                self._set_records_values(dict_values=dict_values)
+                dict_merge["Updated"] = len(df_changed)
+
+        # ------ insert new records ------- #
+        df_new = df[vct_new].reset_index(drop=True)
+        if len(df_new) > 0:
+            n_start = len(self._data)
+            self._data = pd.concat([self._data, df_new], ignore_index=True)
+            self._on_insert(input_df=df_new, n_start=n_start)
+            n_max = self._parse_recid(df_new[self.recid_field]).max()
+            if not pd.isna(n_max):
+                self._last_id = max(self._last_id, int(n_max))
+            dict_merge["Inserted"] = len(df_new)
+
+        # bulk changes are not journaled
+        self._journal_synced = False
+        self.update()
+        return dict_merge
 
     def insert_record(self, dict_rec):
         """Insert a record in the RT
@@ -480,26 +2073,74 @@ class RecordTable(DataSet):
         :return: None
         :rtype: None
         """
-
-        # ------ parse expected fields ------- #
-        # filter expected columns
-        dict_rec_filter = self._filter_dict_rec(input_dict=dict_rec)
-        # ------ set default fields ------- #
-        # set table field
-        dict_rec_filter[self.rectable_field] = self.name
-        # create index
-        dict_rec_filter[self.recid_field] = self._next_recid()
-        # compute timestamp
-        dict_rec_filter[self.rectimest_field] = self._get_timestamp()
-        # set active
-        dict_rec_filter[self.recstatus_field] = "On"
+        # materialize pending records first (table order matches RecId order)
+        self.flush()
+        dict_rec_filter = self._make_record(
+            dict_rec=dict_rec,
+            rec_id=self._next_recid(),
+            timestamp=self.get_datetime(),
+        )
 
         # ------ merge ------- #
         # create single-row dataframe
         df = pd.DataFrame({k: [dict_rec_filter[k]] for k in dict_rec_filter})
+        df = df.reindex(columns=self._get_organized_columns())
+        df = self._prepare_data(self._set_base_dtypes(df))
+        n_start = 0 if self._data is None else len(self._data)
         # concat to data
-        self.data = pd.concat([self.data, df]).reset_index(drop=True)
+        self._data = pd.concat([self._data, df], ignore_index=True)
+        self._on_insert(input_df=df, n_start=n_start)
+        rec_id = dict_rec_filter[self.recid_field]
+        self._log_change(op="insert", rec_id=rec_id, dict_rec=dict_rec_filter)
+
+        self.update()
+        return None
 
+    def insert_records(self, list_recs):
+        """Insert many records in the RT.
+        Records are stamped once and kept in an append buffer, which is
+        flushed into the data table on the next read or save.
+
+        :param list_recs: iterable of input record dictionaries
+        :type list_recs: list
+        :return: None
+        :rtype: None
+        """
+        n_last_id = self._last_id_int()
+        timestamp = self.get_datetime()
+        for i, dict_rec in enumerate(list_recs, start=1):
+            rec_id = self._make_recid(id_int=n_last_id + i)
+            dict_rec_new = self._make_record(
+                dict_rec=dict_rec, rec_id=rec_id, timestamp=timestamp
+            )
+            self._buffer.append(dict_rec_new)
+            self._last_id = n_last_id + i
+            self._log_change(op="insert", rec_id=rec_id, dict_rec=dict_rec_new)
+        # update size without materializing
+        n_data = 0 if self._data is None else len(self._data)
+        self.size = n_data + len(self._buffer)
+        return None
+
+    def flush(self):
+        """Flush the append buffer into the data table with a single concat.
+
+        :return: None
+        :rtype: None
+        """
+        self._load_lazy()
+        if not self._buffer:
+            return None
+        # release buffer before any read
+        list_recs = self._buffer
+        self._buffer = []
+        df = pd.DataFrame.from_records(
+            list_recs, columns=self._get_organized_columns()
+        )
+        df = self._prepare_data(self._set_base_dtypes(df))
+        n_start = 0 if self._data is None else len(self._data)
+        # ------ merge ------- #
+        self._data = pd.concat([self._data, df], ignore_index=True)
+        self._on_insert(input_df=df, n_start=n_start)
         self.update()
         return None
 
@@ -521,27 +2162,142 @@ class RecordTable(DataSet):
         else:
             dict_rec_filter = dict_rec
         # include timestamp for edit operation
-        dict_rec_filter[self.rectimest_field] = self._get_timestamp()
+        dict_rec_filter[self.rectimest_field] = self.get_datetime()
 
-        # get data
-        df = self.data.copy()
-        # set index
-        df = df.set_index(self.recid_field)
-        # get filter series by rec id
-        sr = df.loc[rec_id].copy()
+        dict_old = self._set_record_values(rec_id=rec_id, dict_rec=dict_rec_filter)
+        self._log_change(
+            op="edit", rec_id=rec_id, dict_rec=dict_rec_filter, dict_old=dict_old
+        )
+        return None
 
-        # update edits
-        for k in dict_rec_filter:
-            sr[k] = dict_rec_filter[k]
+    def _set_record_values(self, rec_id, dict_rec):
+        """Set record values in place.
 
-        # set in row
-        df.loc[rec_id] = sr
-        # restore index
-        df.reset_index(inplace=True)
-        self.data = df.copy()
+        :param rec_id: record id
+        :type rec_id: str
+        :param dict_rec: record dictionary with fields to set
+        :type dict_rec: dict
+        :return: record dictionary with previous values of set fields
+        :rtype: dict
+        """
+        # locate row by index
+        n_pos = self._get_position(rec_id=rec_id)
+
+        # update edits in place
+        dict_old = {}
+        dict_new = {}
+        for k in dict_rec:
+            if k in self._data.columns:
+                n_col = self._data.columns.get_loc(k)
+                dict_old[k] = self._data.iat[n_pos, n_col]
+                self._data.iat[n_pos, n_col] = dict_rec[k]
+                dict_new[k] = dict_rec[k]
+        self._on_edit(n_pos=n_pos, dict_old=dict_old, dict_new=dict_new)
+        return dict_old
+
+    def edit_records(self, records, filter_dict=True):
+        """Edit many RT records in a single pass, stamped with one timestamp.
+
+        :param records: dictionary of record dictionaries by record id, or
+            dataframe with the ``RecId`` column and the fields to set
+        :type records: dict or :class:`pandas.DataFrame`
+        :param filter_dict: option for filtering incoming fields
+        :type filter_dict: bool
+        :return: None
+        :rtype: None
+        """
+        # field -> (record ids, values)
+        dict_values = {}
+        if isinstance(records, pd.DataFrame):
+            vct_ids = records[self.recid_field].values
+            for k in records.columns:
+                if k != self.recid_field:
+                    dict_values[k] = (vct_ids, records[k].values)
+        else:
+            for rec_id in records:
+                for k in records[rec_id]:
+                    if k not in dict_values:
+                        dict_values[k] = ([], [])
+                    dict_values[k][0].append(rec_id)
+                    dict_values[k][1].append(records[rec_id][k])
+            vct_ids = list(records)
+        if filter_dict:
+            dict_values = {
+                k: dict_values[k] for k in dict_values if k in self.columns_data
+            }
+        list_fields = list(dict_values)
+        # include timestamp for edit operation
+        timestamp = self.get_datetime()
+        dict_values[self.rectimest_field] = (vct_ids, timestamp)
 
+        dict_old = self._set_records_values(dict_values=dict_values)
+        if self.journal or self.history:
+            dict_olds = self._get_records_dicts(
+                dict_values=dict_values, dict_old=dict_old
+            )
+            if isinstance(records, pd.DataFrame):
+                list_recs = records[list_fields].to_dict(orient="records")
+            else:
+                list_recs = [
+                    {k: records[rec_id][k] for k in records[rec_id] if k in list_fields}
+                    for rec_id in vct_ids
+                ]
+            for rec_id, dict_rec in zip(vct_ids, list_recs):
+                dict_rec[self.rectimest_field] = timestamp
+                self._log_change(
+                    op="edit",
+                    rec_id=rec_id,
+                    dict_rec=dict_rec,
+                    dict_old=dict_olds[rec_id],
+                )
         return None
 
+    def _set_records_values(self, dict_values):
+        """Set values of many records in place, one column at a time.
+
+        :param dict_values: dictionary of (record ids, values) by field
+        :type dict_values: dict
+        :return: dictionary of previous values by set field
+        :rtype: dict
+        """
+        # locate all rows before any change (once per list of ids)
+        dict_ids = {}
+        dict_pos = {}
+        for k in dict_values:
+            if k in self._data.columns:
+                rec_ids = dict_values[k][0]
+                if id(rec_ids) not in dict_ids:
+                    dict_ids[id(rec_ids)] = self._get_positions(rec_ids=rec_ids)
+                dict_pos[k] = dict_ids[id(rec_ids)]
+        # update edits in place
+        dict_old = {}
+        for k in dict_pos:
+            n_col = self._data.columns.get_loc(k)
+            dict_old[k] = self._data.iloc[dict_pos[k], n_col].values
+            self._data.iloc[dict_pos[k], n_col] = dict_values[k][1]
+        if len(dict_pos) > 0:
+            vct_pos = np.unique(np.concatenate(list(dict_pos.values())))
+            self._on_edit_rows(vct_pos=vct_pos, columns=list(dict_pos))
+        return dict_old
+
+    def _get_records_dicts(self, dict_values, dict_old):
+        """Get record dictionaries of previous values from a bulk edit.
+
+        :param dict_values: dictionary of (record ids, values) by field
+        :type dict_values: dict
+        :param dict_old: dictionary of previous values by field
+        :type dict_old: dict
+        :return: dictionary of record dictionaries by record id
+        :rtype: dict
+        """
+        dict_recs = {}
+        for k in dict_old:
+            for rec_id, value in zip(dict_values[k][0], dict_old[k]):
+                if rec_id not in dict_recs:
+                    dict_recs[rec_id] = {}
+                dict_recs[rec_id][k] = value
+        return dict_recs
+
     def archive_record(self, rec_id):
         """Archive a record in the RT, that is ``RecStatus`` = ``Off``
 
@@ -550,26 +2306,114 @@ class RecordTable(DataSet):
         :return: None
         :rtype: None
         """
-        dict_rec = {self.recstatus_field: "Off"}
-        self.edit_record(rec_id=rec_id, dict_rec=dict_rec, filter_dict=False)
+        dict_rec = {
+            self.recstatus_field: False,
+            self.rectimest_field: self.get_datetime(),
+        }
+        dict_old = self._set_record_values(rec_id=rec_id, dict_rec=dict_rec)
+        self._log_change(
+            op="archive", rec_id=rec_id, dict_rec=dict_rec, dict_old=dict_old
+        )
         return None
 
-    def get_record(self, rec_id):
+    def archive_records(self, rec_ids):
+        """Archive many records in the RT in a single pass.
+
+        :param rec_ids: record ids
+        :type rec_ids: list
+        :return: None
+        :rtype: None
+        """
+        rec_ids = list(rec_ids)
+        timestamp = self.get_datetime()
+        dict_values = {
+            self.recstatus_field: (rec_ids, False),
+            self.rectimest_field: (rec_ids, timestamp),
+        }
+        dict_old = self._set_records_values(dict_values=dict_values)
+        if self.journal or self.history:
+            dict_olds = self._get_records_dicts(
+                dict_values=dict_values, dict_old=dict_old
+            )
+            dict_rec = {self.recstatus_field: False, self.rectimest_field: timestamp}
+            for rec_id in rec_ids:
+                self._log_change(
+                    op="archive",
+                    rec_id=rec_id,
+                    dict_rec=dict_rec,
+                    dict_old=dict_olds[rec_id],
+                )
+        return None
+
+    def get_record(self, rec_id, as_of=None):
         """Get a record dict by id
 
         :param rec_id: record id
         :type rec_id: str
+        :param as_of: timestamp for reading the record from the version
+            history. If None, it takes the current record.
+        :type as_of: str or :class:`datetime.datetime`
         :return: record dictionary
         :rtype: dict
         """
-        # set index
-        df = self.data.set_index(self.recid_field)
+        # locate row by index
+        n_pos = self._get_position(rec_id=rec_id)
+        if as_of is None:
+            sr = self.data.iloc[n_pos]
+        else:
+            df = self._get_data_as_of(df=self.data.iloc[[n_pos]], timestamp=as_of)
+            if len(df) == 0:
+                raise KeyError(rec_id)
+            sr = df.iloc[0]
 
-        # locate series by index and convert to dict
+        # convert to dict
         dict_rec = {self.recid_field: rec_id}
-        dict_rec.update(dict(df.loc[rec_id].copy()))
+        dict_rec.update({k: sr[k] for k in sr.index if k != self.recid_field})
         return dict_rec
 
+    def find(self, **criteria):
+        """Find the records matching all criteria on fields.
+        Criteria on indexed fields are answered by the secondary indexes and
+        the remaining criteria only scan the candidate rows.
+
+        Each criterion is either a value (equality), a list of values
+        (membership) or a ``(min, max)`` tuple (inclusive range, ``None`` for
+        open ends).
+
+        :param criteria: field criteria, e.g. ``Kind="A", Value=(1, 5)``
+        :type criteria: dict
+        :return: records matching the criteria
+        :rtype: :class:`pandas.DataFrame`
+        """
+        df = self.data
+        vct_pos = None
+        dict_scan = {}
+        for k in criteria:
+            vct_found = self._lookup_index(field=k, value=criteria[k])
+            if vct_found is None:
+                dict_scan[k] = criteria[k]
+            elif vct_pos is None:
+                vct_pos = vct_found
+            else:
+                vct_pos = np.intersect1d(vct_pos, vct_found, assume_unique=True)
+        if vct_pos is not None:
+            df = df.iloc[vct_pos]
+        # scan candidates for non-indexed criteria
+        vct_mask = np.ones(len(df), dtype=bool)
+        for k in dict_scan:
+            value = dict_scan[k]
+            if isinstance(value, tuple):
+                lo, hi = value
+                if lo is not None:
+                    vct_mask = vct_mask & (df[k] >= lo).values
+                if hi is not None:
+                    vct_mask = vct_mask & (df[k] <= hi).values
+            elif isinstance(value, (list, set)):
+                vct_mask = vct_mask & df[k].isin(list(value)).values
+            else:
+                vct_mask = vct_mask & (df[k] == value).values
+        return df[vct_mask]
+
     def get_record_df(self, rec_id):
         """Get a record dataframe by id
 
@@ -635,8 +2479,10 @@ class RecordTable(DataSet):
         :return: path to exported file
         :rtype: str
         """
-        # retrieve dataframe
-        df = self.get_record_df(rec_id=rec_id)
+        # retrieve record with base fields in textual form
+        n_pos = self._get_position(rec_id=rec_id)
+        sr = self._get_text_df(self.data.iloc[[n_pos]]).iloc[0]
+        df = pd.DataFrame({"Field": list(sr.index), "Value": list(sr.values)})
         # handle filename and folder
         if filename is None:
             filename = self.name + "_" + rec_id
@@ -650,19 +2496,25 @@ class RecordTable(DataSet):
     # ----------------- STATIC METHODS ----------------- #
     @staticmethod
     def timedelta_disagg(timedelta):
-        """Util static method for dissaggregation of time delta
+        """Util static method for dissaggregation of time delta.
+        Vectorized with integer arithmetic on nanoseconds.
 
-        :param timedelta: TimeDelta object from pandas
-        :type timedelta: :class:`pandas.TimeDelta`
-        :return: dictionary of time delta
+        :param timedelta: TimeDelta object from pandas or array of time deltas
+        :type timedelta: :class:`pandas.TimeDelta` or array-like
+        :return: dictionary of time delta (of arrays, if array-like input)
         :rtype: dict
         """
-        days = timedelta.days
-        years, days = divmod(days, 365)
-        months, days = divmod(days, 30)
-        hours, remainder = divmod(timedelta.seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return {
+        is_scalar = pd.api.types.is_scalar(timedelta)
+        vct_td = pd.to_timedelta(np.atleast_1d(timedelta)).values
+        vct_nat = np.isnat(vct_td)
+        vct_ns = vct_td.astype("timedelta64[ns]").astype(np.int64)
+        n_day = 86400 * 10**9
+        days, remainder = np.divmod(vct_ns, n_day)
+        years, days = np.divmod(days, 365)
+        months, days = np.divmod(days, 30)
+        hours, remainder = np.divmod(remainder // 10**9, 3600)
+        minutes, seconds = np.divmod(remainder, 60)
+        dict_td = {
             "Years": years,
             "Months": months,
             "Days": days,
@@ -670,23 +2522,46 @@ class RecordTable(DataSet):
             "Minutes": minutes,
             "Seconds": seconds,
         }
+        for k in dict_td:
+            if is_scalar:
+                dict_td[k] = int(dict_td[k][0])
+            else:
+                dict_td[k] = pd.array(dict_td[k], dtype="Int64")
+                dict_td[k][vct_nat] = pd.NA
+        return dict_td
 
     @staticmethod
     def timedelta_to_str(timedelta, dct_struct):
-        """Util static method for string conversion of timedelta
+        """Util static method for string conversion of timedelta.
+        Vectorized string assembly for array-like input.
 
-        :param timedelta: TimeDelta object from pandas
-        :type timedelta: :class:`pandas.TimeDelta`
+        :param timedelta: TimeDelta object from pandas or array of time deltas
+        :type timedelta: :class:`pandas.TimeDelta` or array-like
         :param dct_struct: Dictionary of string strucuture. Ex: {'Expected days': 'Days'}
         :type dct_struct: dict
-        :return: text of time delta
-        :rtype: str
+        :return: text of time delta (array of texts, if array-like input)
+        :rtype: str or :class:`numpy.ndarray`
         """
         dct_td = RecordTable.timedelta_disagg(timedelta=timedelta)
-        parts = []
-        for k in dct_struct:
-            parts.append("{}: {}".format(dct_struct[k], dct_td[k]))
-        return ", ".join(parts)
+        if pd.api.types.is_scalar(timedelta):
+            parts = []
+            for k in dct_struct:
+                parts.append("{}: {}".format(dct_struct[k], dct_td[k]))
+            return ", ".join(parts)
+        # assemble texts only for unique combinations of parts
+        mtx_parts = np.column_stack(
+            [dct_td[k].to_numpy(dtype=np.int64, na_value=0) for k in dct_struct]
+        )
+        mtx_unique, vct_inverse = np.unique(mtx_parts, axis=0, return_inverse=True)
+        list_text = [
+            ", ".join(
+                "{}: {}".format(dct_struct[k], n) for k, n in zip(dct_struct, row)
+            )
+            for row in mtx_unique.tolist()
+        ]
+        vct_text = np.array(list_text, dtype=object)[vct_inverse.ravel()]
+        vct_text[pd.isna(dct_td["Years"])] = None
+        return vct_text
 
     @staticmethod
     def running_time(start_datetimes, kind="raw"):
@@ -696,7 +2571,8 @@ class RecordTable(DataSet):
         :type start_datetimes: list
         :param kind: mode for output format ('raw', 'human' or 'age')
         :type kind: str
-        :return: list of running time
+        :return: list of running time (series of texts for 'human', array of
+            years for 'age')
         :rtype: list
         """
         # Convert 'start_datetimes' to datetime format
@@ -709,10 +2585,14 @@ class RecordTable(DataSet):
             running_time = running_time.tolist()
         elif kind == "human":
             dct_str = {"Years": "yr", "Months": "mth"}
-            running_time = running_time.apply(
-                RecordTable.timedelta_to_str, args=(dct_str,)
+            vct_text = RecordTable.timedelta_to_str(running_time, dct_str)
+            running_time = pd.Series(
+                vct_text, index=getattr(running_time, "index", None)
             )
         elif kind == "age":
-            running_time = [int(e.days / 365) for e in running_time]
+            vct_td = np.asarray(running_time, dtype="timedelta64[ns]")
+            vct_days = np.floor_divide(vct_td.astype(np.int64), 86400 * 10**9)
+            running_time = pd.array((vct_days / 365).astype(int), dtype="Int64")
+            running_time[np.isnat(vct_td)] = pd.NA
 
         return running_time
@@ -0,0 +1,76 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.dataset.record_table import RecordTable
+
+# rows in the benchmark input (opt-in: set the BCMK_ROWS variable, e.g. 1000000)
+N_ROWS = int(os.environ.get("BCMK_ROWS", 1000000))
+
+
+def make_input_df(n=N_ROWS):
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "Kind": rng.choice(["A", "B", "C"], size=n),
+            "Value": rng.random(size=n),
+        }
+    )
+
+
+def legacy_set_data(rt, input_df):
+    # former normalization path (inplace=False, append=True)
+    list_input_cols = list(input_df.columns)
+    input_df[rt.rectable_field] = rt.name
+    n_incr = rt._last_id_int() + 1
+    input_df[rt.recid_field] = [
+        rt._make_recid(id_int=_ + n_incr) for _ in range(len(input_df))
+    ]
+    if rt.rectimest_field not in list_input_cols:
+        input_df[rt.rectimest_field] = rt.get_datetime()
+    if rt.recstatus_field not in list_input_cols:
+        input_df[rt.recstatus_field] = True
+    for column in rt._get_organized_columns():
+        if column not in input_df.columns:
+            input_df[column] = ""
+    df_merged = input_df[rt._get_organized_columns()]
+    df_merged = rt._set_base_dtypes(df_merged)
+    df_merged = rt._prepare_data(df_merged)
+    if rt.data is not None:
+        df_merged = pd.concat([rt.data, df_merged], ignore_index=True)
+    return df_merged.copy()
+
+
+def get_time(func):
+    t0 = time.perf_counter()
+    output = func()
+    return time.perf_counter() - t0, output
+
+
+@pytest.mark.skipif("BCMK_ROWS" not in os.environ, reason="set BCMK_ROWS to run")
+def test_bcmk_set_data():
+    df = make_input_df()
+    rt = RecordTable(name="RT", alias="RT")
+
+    t_legacy, df_legacy = get_time(lambda: legacy_set_data(rt, df.copy()))
+    t_copy, df_copy = get_time(lambda: rt.set_data(input_df=df, inplace=False))
+    t_adopt, df_adopt = get_time(
+        lambda: rt.set_data(input_df=df, inplace=False, copy=False)
+    )
+
+    # same normalized table
+    list_columns = [c for c in df_copy.columns if c != rt.rectimest_field]
+    assert df_copy[list_columns].equals(df_legacy[list_columns])
+    # adopted columns share memory with the incoming data
+    assert np.shares_memory(df_adopt["Value"].values, df["Value"].values)
+    assert not np.shares_memory(df_copy["Value"].values, df["Value"].values)
+    # incoming dataframe is untouched
+    assert list(df.columns) == ["Kind", "Value"]
+
+    print("\nset_data normalization of {} rows".format(N_ROWS))
+    print("legacy:           {:.3f} s".format(t_legacy))
+    print("vectorized:       {:.3f} s ({:.1f}x)".format(t_copy, t_legacy / t_copy))
+    print("vectorized+adopt: {:.3f} s ({:.1f}x)".format(t_adopt, t_legacy / t_adopt))
@@ -0,0 +1,178 @@
+import pandas as pd
+
+from src.dataset.budget import Budget
+
+
+def make_budget_df():
+    return pd.DataFrame(
+        {
+            "Type": ["Revenue", "Expense", "Expense", "Revenue"],
+            "Status": ["Executed", "Executed", "Prospected", "Expected"],
+            "Contract": ["C1", "C1", "C2", "C2"],
+            "Name": ["a", "b", "c", "d"],
+            "Value": [100.0, 30.0, 50.0, 20.0],
+            "Tags": ["x y", "x", "y", "z"],
+        }
+    )
+
+
+def make_budget():
+    b = Budget(name="B", alias="B")
+    b.set_data(input_df=make_budget_df())
+    b.update()
+    return b
+
+
+def test_budget_totals():
+    b = make_budget()
+    assert b.total_revenue == 120.0
+    assert b.total_expenses == -30.0
+    assert b.total_net == 90.0
+
+
+def test_budget_totals_from_file(tmp_path):
+    b = make_budget()
+    f = b.export(folder_export=str(tmp_path), filename="bud")
+    b2 = Budget(name="B", alias="B")
+    d = b2.get_totals_from_file(file_data=f, chunksize=3)
+    assert d["Total_Net"] == b.total_net
+    assert [len(df) for df in b2.iter_data(file_data=f, chunksize=3)] == [3, 1]
+    assert b2.data is None
+
+
+def test_budget_totals_incremental():
+    b = make_budget()
+    b.insert_record(dict_rec={"Type": "Expense", "Status": "Executed", "Value": 10})
+    assert b.total_expenses == -40.0
+    b.edit_record(rec_id="Rec0001", dict_rec={"Value": 150})
+    assert b.total_revenue == 170.0
+    b.edit_record(rec_id="Rec0003", dict_rec={"Status": "Executed"})
+    assert b.total_expenses == -90.0
+    b.insert_records(list_recs=[{"Type": "Revenue", "Status": "Expected", "Value": 5}])
+    b.flush()
+    assert b.total_revenue == 175.0
+    b._build_totals()
+    b._set_totals()
+    assert b.total_net == 85.0
+
+
+def test_parse_annual_budget():
+    df = pd.DataFrame(
+        {"Contract": ["Rent", "Tax", "Fee"], "Freq": ["MS", "QS", "YS"]}
+    )
+    df_year = Budget.parse_annual_budget(year=2024, budget_df=df)
+    assert len(df_year) == 12 + 4 + 1
+    assert list(df_year["Contract"][:12]) == ["Rent"] * 12
+    assert df_year["Date"].iloc[12] == pd.Timestamp("2024-01-01")
+    df_decade = Budget.parse_annual_budget(year=2024, budget_df=df, n_years=10)
+    assert len(df_decade) == 170
+    assert df_decade["Date"].max() == pd.Timestamp("2033-12-01")
+
+
+def test_budget_summary_cache():
+    b = make_budget()
+    sr = b.get_summary_by_contract()
+    assert b.get_summary_by_contract() is sr
+    assert sr["C1"] == 70.0
+    b.edit_record(rec_id="Rec0002", dict_rec={"Value": 40})
+    sr2 = b.get_summary_by_contract()
+    assert sr2 is not sr
+    assert sr2["C1"] == 60.0
+    assert b.get_summary_by_status()["Executed"] == 60.0
+
+
+def test_budget_tag_index():
+    b = make_budget()
+    df = b.get_summary_by_tags(filter=False)
+    assert df.loc["x", "Value_Signed"] == 70.0
+    assert df.loc["y", "Count"] == 2
+    assert "y" in b.get_summary_by_tags(filter=True).index
+    assert b.get_summary_by_tags(filter=True).loc["y", "Count"] == 1
+    b.insert_record(
+        dict_rec={"Type": "Revenue", "Status": "Executed", "Value": 1, "Tags": "x z"}
+    )
+    b.edit_record(rec_id="Rec0002", dict_rec={"Tags": "z"})
+    assert list(b.get_records_by_tags(tags=["x", "z"])["RecId"]) == ["Rec0005"]
+    assert len(b.get_records_by_tags(tags=["x", "z"], match="any")) == 4
+    assert b.get_summary_by_tags(filter=False).loc["x", "Count"] == 2
+
+
+def test_budget_refresh_status():
+    b = make_budget()
+    b.edit_record(
+        rec_id="Rec0004", dict_rec={"Method": "Automatic", "Date_Due": "2020-01-01"}
+    )
+    b.refresh_data()
+    assert b.get_record(rec_id="Rec0004")["Status"] == "Executed"
+    assert b.get_summary_by_status()["Executed"] == 90.0
+
+
+def test_budget_due_index():
+    b = make_budget()
+    b.edit_record(
+        rec_id="Rec0004", dict_rec={"Method": "Automatic", "Date_Due": "2200-01-01"}
+    )
+    b.refresh_data()
+    assert b.get_record(rec_id="Rec0004")["Status"] == "Expected"
+    assert len(b._due_heap) == 1
+    b.edit_record(rec_id="Rec0004", dict_rec={"Date_Due": "2001-01-01"})
+    assert b._update_due_status() == 1
+    # stale future item is skipped later
+    assert len(b._due_heap) == 1
+    assert b.get_record(rec_id="Rec0004")["Status"] == "Executed"
+    assert b.total_revenue == 120.0
+
+
+def test_budget_date_shadow_columns():
+    b = make_budget()
+    assert pd.isna(b.get_dates(field="Date_Due")).all()
+    b.edit_record(rec_id="Rec0002", dict_rec={"Date_Due": "2024-03-01"})
+    b.insert_record(dict_rec={"Type": "Expense", "Date_Due": "2024-04-01"})
+    sr_due = b.get_dates(field="Date_Due")
+    assert sr_due[1] == pd.Timestamp("2024-03-01")
+    assert sr_due[4] == pd.Timestamp("2024-04-01")
+    # rows subset
+    df = b.data.iloc[[4, 1]]
+    assert list(b.get_dates(field="Date_Due", df=df)) == list(sr_due[[4, 1]])
+    assert b._dates["Date_Due"].dtype == "datetime64[ns]"
+
+
+def test_budget_find_from_empty():
+    b = Budget(name="B", alias="B")
+    b.insert_record(dict_rec={"Type": "Expense", "Status": "Expected", "Value": 5})
+    assert len(b.find(Status="Expected")) == 1
+    assert len(b.find(Status="Executed")) == 0
+
+
+def test_budget_edit_records_bulk():
+    b = make_budget()
+    b.edit_records(
+        records={
+            "Rec0002": {"Value": 40},
+            "Rec0003": {"Status": "Executed"},
+            "Rec0004": {"Type": "Expense", "Tags": "w"},
+        }
+    )
+    assert b.total_revenue == 100.0
+    assert b.total_expenses == -110.0
+    assert list(b.get_records_by_tags(tags=["w"])["RecId"]) == ["Rec0004"]
+    assert b.get_record(rec_id="Rec0004")["Value_Signed"] == -20.0
+
+
+def test_budget_unload_after_read_keeps_file(tmp_path):
+    df = make_budget_df()
+    df["Method"] = ["", "", "", "Automatic"]
+    df["Date_Due"] = ["", "", "", "2020-01-01"]
+    df["Notes"] = "kept"
+    f = str(tmp_path / "budget.csv")
+    df.to_csv(f, sep=";", index=False)
+    with open(f) as file:
+        str_file = file.read()
+    b = Budget(name="B", alias="B")
+    b.lazy = True
+    b._set_lazy(file_data=f)
+    # status recomputed on load is not an unsaved change
+    assert b.data["Status"].iloc[3] == "Executed"
+    b.unload()
+    with open(f) as file:
+        assert file.read() == str_file
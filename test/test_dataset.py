@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from src.dataset.base import DataSet
+
+
+def make_data_file(folder, n=10):
+    df = pd.DataFrame(
+        {
+            "P": [float(i) for i in range(n)],
+            "RM": [float(i) * 2 for i in range(n)],
+            "TempDB": [float(i) * 3 for i in range(n)],
+        }
+    )
+    f = str(folder / "data_ds.csv")
+    df.to_csv(f, sep=";", index=False)
+    return f
+
+
+def test_count_data_streaming(tmp_path):
+    f = make_data_file(tmp_path, n=10)
+    ds = DataSet()
+    assert ds.count_data(file_data=f, chunksize=3) == 10
+    assert [len(df) for df in ds.iter_data(file_data=f, chunksize=4)] == [4, 4, 2]
+
+
+def test_load_data_schema_pushdown(tmp_path):
+    f = make_data_file(tmp_path, n=10)
+    df = pd.read_csv(f, sep=";")
+    df["Extra"] = "x"
+    df.loc[2, "RM"] = None
+    df.to_csv(f, sep=";", index=False)
+    ds = DataSet()
+    ds.load_data(file_data=f)
+    # only schema columns, rows with missing required values dropped
+    assert list(ds.data.columns) == ["P", "RM", "TempDB"]
+    assert len(ds.data) == 9
+    ds.columns_data_filters = {"P": (3, None), "TempDB": [12.0, 15.0, 27.0]}
+    ds.chunksize = 4
+    ds.load_data(file_data=f)
+    assert ds.data["P"].tolist() == [4.0, 5.0, 9.0]
+    assert ds.count_data(file_data=f) == 3
+
+
+def test_density_grid():
+    rng = np.random.default_rng(0)
+    vct_x = rng.random(100000)
+    vct_y = rng.random(100000)
+    vct_x[0] = np.nan
+    grid = DataSet.get_density_grid(vct_x, vct_y, bins=10, extent=(0, 1, 0, 1))
+    assert grid.shape == (10, 10)
+    assert grid.sum() == 99999
+    grid_np, _, _ = np.histogram2d(
+        vct_x[1:], vct_y[1:], bins=10, range=[[0, 1], [0, 1]]
+    )
+    assert (grid == grid_np).all()
+
+
+def test_view_numbers_datetime():
+    sr = pd.Series(pd.to_datetime(["2024-01-01", None, "2024-01-02"]))
+    vct = DataSet._get_view_numbers(values=sr)
+    assert np.isnan(vct[1])
+    assert vct[2] - vct[0] == 86400e9
+    vct_lim = DataSet._get_view_numbers(values=[sr.min(), sr.max()])
+    assert (vct_lim == vct[[0, 2]]).all()
+    grid = DataSet.get_density_grid(vct, vct, bins=2, extent=(*vct_lim, *vct_lim))
+    assert grid.sum() == 2
@@ -0,0 +1,560 @@
+import datetime
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.dataset.record_table import RecordTable
+
+
+def make_record_table(n=5):
+    rt = RecordTable(name="RT", alias="RT")
+    df = pd.DataFrame(
+        {
+            "Kind": ["A"] * n,
+            "Value": list(range(n)),
+            "Category": ["x"] * n,
+        }
+    )
+    rt.set_data(input_df=df)
+    return rt
+
+
+def test_get_record_by_index():
+    rt = make_record_table()
+    d = rt.get_record(rec_id="Rec0003")
+    assert d["RecId"] == "Rec0003"
+    assert d["Value"] == 2
+
+
+def test_edit_and_archive_record():
+    rt = make_record_table()
+    rt.insert_record(dict_rec={"Kind": "B", "Value": 10})
+    rt.edit_record(rec_id="Rec0006", dict_rec={"Value": 11})
+    rt.archive_record(rec_id="Rec0002")
+    assert rt.get_record(rec_id="Rec0006")["Value"] == 11
+    assert not rt.get_record(rec_id="Rec0002")["RecStatus"]
+    assert len(rt.data) == 6
+
+
+def test_insert_records_buffered():
+    rt = make_record_table()
+    rt.insert_records(list_recs=[{"Kind": "B", "Value": i} for i in range(3)])
+    assert rt.size == 8
+    assert len(rt._buffer) == 3
+    assert rt.get_record(rec_id="Rec0008")["Value"] == 2
+    assert len(rt._buffer) == 0
+    assert len(rt.data) == 8
+    # single inserts land after buffered records
+    rt.insert_records(list_recs=[{"Kind": "B", "Value": 9}])
+    rt.insert_record(dict_rec={"Kind": "B", "Value": 10})
+    assert list(rt.data["RecId"])[-2:] == ["Rec0009", "Rec0010"]
+
+
+def test_set_data_normalization(monkeypatch):
+    timestamp = datetime.datetime(2030, 1, 1, 12)
+    monkeypatch.setattr(RecordTable, "get_datetime", staticmethod(lambda: timestamp))
+    rt = RecordTable(name="RT", alias="RT")
+    df = pd.DataFrame({"Kind": ["A", "B"], "Value": [1.5, 2.5]})
+    df_input = df.copy()
+    df_expected = pd.DataFrame(
+        {
+            "RecId": ["Rec0001", "Rec0002"],
+            "RecTable": pd.Categorical(["RT", "RT"]),
+            "RecTimestamp": pd.Series([timestamp] * 2, dtype="datetime64[us]"),
+            "RecStatus": [True, True],
+            "Kind": ["A", "B"],
+            "Value": [1.5, 2.5],
+            "Category": ["", ""],
+            "File_NF": ["", ""],
+            "File_Invoice": ["", ""],
+        }
+    )
+    df_copy = rt.set_data(input_df=df, inplace=False)
+    pd.testing.assert_frame_equal(df_copy, df_expected)
+    df_adopt = rt.set_data(input_df=df, inplace=False, copy=False)
+    pd.testing.assert_frame_equal(df_adopt, df_expected)
+    # adopted columns share memory with the incoming data
+    assert np.shares_memory(df_adopt["Value"].values, df["Value"].values)
+    assert not np.shares_memory(df_copy["Value"].values, df["Value"].values)
+    # incoming dataframe is untouched
+    pd.testing.assert_frame_equal(df, df_input)
+    # appended ids continue the table, incoming ids are kept
+    rt.set_data(input_df=df)
+    rt.set_data(input_df=pd.DataFrame({"Value": [3.0], "RecId": ["Rec0010"]}))
+    rt.set_data(input_df=pd.DataFrame({"Value": [4.0]}))
+    assert list(rt.data["RecId"]) == ["Rec0001", "Rec0002", "Rec0010", "Rec0011"]
+    assert list(rt.data["Kind"]) == ["A", "B", "", ""]
+
+
+def test_recid_counter_beyond_id_size():
+    rt = make_record_table(n=3)
+    rt.edit_record(rec_id="Rec0003", dict_rec={"Value": 3})
+    df = pd.DataFrame({"RecId": ["Rec9999", "Rec10000"], "Value": [1, 2]})
+    rt.set_data(input_df=df)
+    assert rt._last_id_int() == 10000
+    rt.insert_record(dict_rec={"Value": 5})
+    assert rt.get_record(rec_id="Rec10001")["Value"] == 5
+
+
+def test_save_and_load_csv(tmp_path):
+    rt = make_record_table()
+    f = rt.export(folder_export=str(tmp_path), filename="rt")
+    assert f.endswith(".csv")
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2.load_data(file_data=f)
+    assert rt2.get_record(rec_id="Rec0005")["Value"] == 4
+
+
+def test_save_and_load_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    rt = make_record_table()
+    f = rt.export(folder_export=str(tmp_path), filename="rt", file_format="parquet")
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2.load_data(file_data=f)
+    rt2.archive_record(rec_id="Rec0001")
+    assert not rt2.get_record(rec_id="Rec0001")["RecStatus"]
+    assert rt2.data["Value"].dtype == rt.data["Value"].dtype
+
+
+def test_columnar_backend_without_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    rt = make_record_table()
+    with pytest.raises(ImportError, match="columnar"):
+        rt.export(folder_export=str(tmp_path), filename="rt", file_format="parquet")
+
+
+def test_journal_save_and_replay(tmp_path):
+    rt = make_record_table()
+    f = rt.export(folder_export=str(tmp_path), filename="rt")
+    rt = RecordTable(name="RT", alias="RT")
+    rt.journal = True
+    rt.load_data(file_data=f)
+    rt.insert_record(dict_rec={"Kind": "B", "Value": 10})
+    rt.edit_record(rec_id="Rec0001", dict_rec={"Value": 99})
+    rt.archive_record(rec_id="Rec0002")
+    rt.save()
+    assert os.path.isfile(rt._get_file_journal())
+    # base file is untouched
+    assert len(pd.read_csv(f, sep=";")) == 5
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2.load_data(file_data=f)
+    assert rt2.get_record(rec_id="Rec0001")["Value"] == 99
+    assert not rt2.get_record(rec_id="Rec0002")["RecStatus"]
+    assert rt2.get_record(rec_id="Rec0006")["Value"] == 10
+    rt2.compact()
+    assert not os.path.isfile(rt2._get_file_journal())
+    assert len(pd.read_csv(f, sep=";")) == 6
+
+
+def test_compact_dotted_file_name(tmp_path):
+    rt = make_record_table()
+    f = rt.export(folder_export=str(tmp_path), filename="inv.2024-01")
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2.journal = True
+    rt2.load_data(file_data=f)
+    rt2.edit_record(rec_id="Rec0001", dict_rec={"Value": 10})
+    rt2.save()
+    rt2.compact()
+    assert sorted(os.listdir(tmp_path)) == ["inv.2024-01.csv", "inv.2024-01_meta.json"]
+    rt3 = RecordTable(name="RT", alias="RT")
+    rt3.load_data(file_data=f)
+    assert rt3.get_record(rec_id="Rec0001")["Value"] == 10
+
+
+def test_base_columns_dtypes(tmp_path):
+    rt = make_record_table()
+    rt.insert_records(list_recs=[{"Kind": "B", "Value": 9}])
+    assert isinstance(rt.data["RecTable"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_bool_dtype(rt.data["RecStatus"])
+    assert pd.api.types.is_datetime64_any_dtype(rt.data["RecTimestamp"])
+    rt.archive_record(rec_id="Rec0001")
+    f = rt.export(folder_export=str(tmp_path), filename="rt")
+    df = pd.read_csv(f, sep=";")
+    assert list(df["RecStatus"]) == ["Off"] + ["On"] * 5
+    f = rt.export(folder_export=str(tmp_path), filename="rt2", filter_archive=True)
+    assert len(pd.read_csv(f, sep=";")) == 5
+
+
+def test_iter_data_allocates_ids_across_chunks(tmp_path):
+    df = pd.DataFrame({"Kind": ["A"] * 5, "Value": range(5)})
+    f = str(tmp_path / "raw.csv")
+    df.to_csv(f, sep=";", index=False)
+    rt = RecordTable(name="RT", alias="RT")
+    list_ids = [i for df in rt.iter_data(file_data=f, chunksize=2) for i in df["RecId"]]
+    assert list_ids == ["Rec000{}".format(i) for i in range(1, 6)]
+    assert rt._last_id_int() == 0
+    assert rt.count_data(file_data=f, chunksize=2) == 5
+
+
+def test_refresh_data_operator_engine():
+    rt = make_record_table()
+    list_calls = []
+
+    def func_double(df):
+        list_calls.append("Double")
+        return df["Value"] * 2
+
+    def func_quad(df):
+        list_calls.append("Quad")
+        return df["Double"] * 2
+
+    rt.operator = {
+        "Quad": {"inputs": ["Double"], "func": func_quad},
+        "Double": {"inputs": ["Value"], "func": func_double},
+    }
+    rt.refresh_data()
+    assert list_calls == ["Double", "Quad"]
+    assert rt.get_record(rec_id="Rec0003")["Quad"] == 8
+    # no input changed
+    rt.refresh_data()
+    assert list_calls == ["Double", "Quad"]
+    # unrelated input changed
+    rt.edit_record(rec_id="Rec0003", dict_rec={"Kind": "B"})
+    rt.refresh_data()
+    assert list_calls == ["Double", "Quad"]
+    # input changed propagates to dependents
+    rt.edit_record(rec_id="Rec0003", dict_rec={"Value": 10})
+    rt.refresh_data()
+    assert list_calls == ["Double", "Quad"] * 2
+    assert rt.get_record(rec_id="Rec0003")["Quad"] == 40
+
+
+def test_refresh_data_dirty_rows():
+    rt = make_record_table()
+    list_sizes = []
+
+    def func_double(df):
+        list_sizes.append(len(df))
+        return df["Value"] * 2
+
+    rt.operator = {"Double": {"inputs": ["Value"], "func": func_double}}
+    rt.refresh_data()
+    rt.edit_record(rec_id="Rec0002", dict_rec={"Value": 7})
+    rt.insert_records(list_recs=[{"Kind": "B", "Value": 3}])
+    rt.refresh_data()
+    assert list_sizes == [5, 2]
+    assert rt.get_record(rec_id="Rec0002")["Double"] == 14
+    assert rt.get_record(rec_id="Rec0006")["Double"] == 6
+    assert rt.get_record(rec_id="Rec0005")["Double"] == 8
+
+
+def test_running_time_vectorized():
+    sr = pd.Series(pd.to_datetime(["2000-01-01", None, "2020-06-15"]))
+    vct_age = RecordTable.running_time(sr, kind="age")
+    assert pd.isna(vct_age[1])
+    assert vct_age[0] > vct_age[2] >= 5
+    sr_human = RecordTable.running_time(sr, kind="human")
+    assert sr_human[1] is None
+    assert sr_human[0].startswith("yr: ")
+    td = pd.Timedelta(days=800, hours=1)
+    dct_struct = {"Years": "yr", "Days": "d"}
+    vct_text = RecordTable.timedelta_to_str(pd.to_timedelta([td]), dct_struct)
+    assert vct_text[0] == RecordTable.timedelta_to_str(td, dct_struct)
+    # negative parts (future dates)
+    dct_struct = {"Months": "m", "Years": "y"}
+    vct_td = pd.to_timedelta(["-40D", "635D"])
+    vct_text = RecordTable.timedelta_to_str(vct_td, dct_struct)
+    assert list(vct_text) == [
+        RecordTable.timedelta_to_str(td, dct_struct) for td in vct_td
+    ]
+
+
+def test_find_with_secondary_indexes():
+    rt = make_record_table(n=6)
+    rt.edit_record(rec_id="Rec0002", dict_rec={"Kind": "B"})
+    rt.insert_records(list_recs=[{"Kind": "B", "Value": 3}])
+    df = rt.find(Kind="B")
+    assert list(df["RecId"]) == ["Rec0002", "Rec0007"]
+    df = rt.find(Value=(2, 4))
+    assert list(df["RecId"]) == ["Rec0003", "Rec0004", "Rec0005", "Rec0007"]
+    df = rt.find(Kind=["A", "B"], Value=3, Category="x")
+    assert list(df["RecId"]) == ["Rec0004"]
+    df = rt.find(Value=[0, 5], RecStatus=True)
+    assert list(df["RecId"]) == ["Rec0001", "Rec0006"]
+    assert len(rt.find(Kind="C")) == 0
+
+
+def test_find_range_skips_missing_values():
+    rt = RecordTable(name="RT", alias="RT")
+    rt.set_data(input_df=pd.DataFrame({"Value": [1, np.nan, 3, 5]}))
+    assert rt.find(Value=(2, None))["Value"].tolist() == [3, 5]
+    assert rt.find(Value=(None, 2))["Value"].tolist() == [1]
+
+
+def test_sorted_index_incremental():
+    rt = make_record_table(n=6)
+    assert list(rt.find(Value=(4, None))["RecId"]) == ["Rec0005", "Rec0006"]
+    rt.edit_record(rec_id="Rec0001", dict_rec={"Value": 9})
+    rt.insert_records(list_recs=[{"Kind": "B", "Value": 4}, {"Kind": "B", "Value": 0}])
+    rt.insert_record(dict_rec={"Kind": "B", "Value": 1})
+    # updated in place, not rebuilt
+    assert rt._indexes["Value"] is not None
+    df = rt.find(Value=(4, None))
+    assert list(df["RecId"]) == ["Rec0001", "Rec0005", "Rec0006", "Rec0007"]
+    assert list(rt.find(Value=1)["RecId"]) == ["Rec0002", "Rec0009"]
+
+
+def test_find_from_empty_table():
+    rt = RecordTable(name="RT", alias="RT")
+    rt.insert_record(dict_rec={"Kind": "A", "Value": 1})
+    rt.insert_records(list_recs=[{"Kind": "B", "Value": 2}])
+    assert list(rt.find(Kind="A")["RecId"]) == ["Rec0001"]
+    assert list(rt.find(Kind="B", Value=(2, None))["RecId"]) == ["Rec0002"]
+
+
+def test_find_after_operator_refresh():
+    rt = make_record_table(n=3)
+    rt.columns_data_dates = {"Date": "ISO8601"}
+    rt.operator = {
+        "Kind": {"inputs": ["Value"], "func": lambda df: df["Value"].map(str)},
+        "Date": {"inputs": ["Value"], "func": lambda df: "2024-01-01"},
+    }
+    rt.refresh_data()
+    assert len(rt.find(Kind="A")) == 0
+    assert list(rt.find(Kind="2")["RecId"]) == ["Rec0003"]
+    assert (rt.get_dates(field="Date") == pd.Timestamp("2024-01-01")).all()
+
+
+def test_edit_and_archive_records_bulk(tmp_path):
+    rt = make_record_table()
+    f = rt.export(folder_export=str(tmp_path), filename="rt")
+    rt = RecordTable(name="RT", alias="RT")
+    rt.journal = True
+    rt.load_data(file_data=f)
+    rt.edit_records(records={"Rec0001": {"Value": 10}, "Rec0002": {"Kind": "B"}})
+    df = pd.DataFrame({"RecId": ["Rec0003", "Rec0004"], "Value": [30, 40]})
+    rt.edit_records(records=df)
+    rt.archive_records(rec_ids=["Rec0004", "Rec0005"])
+    assert list(rt.data["Value"]) == [10, 1, 30, 40, 4]
+    assert list(rt.data["Kind"]) == ["A", "B", "A", "A", "A"]
+    assert list(rt.data["RecStatus"]) == [True] * 3 + [False] * 2
+    assert list(rt.find(Kind="B")["RecId"]) == ["Rec0002"]
+    # unknown ids fail before any change
+    with pytest.raises(KeyError):
+        rt.edit_records(records={"Rec0001": {"Value": 0}, "Rec0099": {"Value": 0}})
+    assert rt.get_record(rec_id="Rec0001")["Value"] == 10
+    # journal replay
+    rt.save()
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2.load_data(file_data=f)
+    pd.testing.assert_frame_equal(rt2.data, rt.data, check_dtype=False)
+
+
+def test_load_data_upsert(tmp_path):
+    rt = make_record_table()
+    f = rt.export(folder_export=str(tmp_path), filename="rt")
+    rt.load_data(file_data=f, upsert=True)
+    rt.load_data(file_data=f, upsert=True, content_hash=True)
+    assert len(rt.data) == 5
+    dict_merge = rt.merge_data(input_df=pd.read_csv(f, sep=";"), content_hash=True)
+    assert dict_merge == {"Inserted": 0, "Updated": 0}
+    # overlapping export with one changed and one new record
+    df = pd.read_csv(f, sep=";")
+    df.loc[0, "Value"] = 50
+    df.loc[5] = df.loc[4]
+    df.loc[5, "RecId"] = "Rec0006"
+    df.to_csv(f, sep=";", index=False)
+    dict_merge = rt.merge_data(input_df=pd.read_csv(f, sep=";"))
+    assert dict_merge == {"Inserted": 1, "Updated": 0}
+    assert rt.get_record(rec_id="Rec0001")["Value"] == 0
+    rt.load_data(file_data=f, upsert=True, content_hash=True)
+    assert rt.get_record(rec_id="Rec0001")["Value"] == 50
+    assert len(rt.data) == 6
+    rt.insert_record(dict_rec={"Value": 7})
+    assert rt.get_record(rec_id="Rec0007")["Value"] == 7
+
+
+def test_load_data_upsert_custom_columns(tmp_path):
+    rt = RecordTable(name="RT", alias="RT")
+    rt.columns_data = ["Name", "Size"]
+    rt.set_data(input_df=pd.DataFrame({"Name": ["a", "b"], "Size": [1, 2]}))
+    f = rt.export(folder_export=str(tmp_path), filename="rt")
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2.columns_data = ["Name", "Size"]
+    rt2.journal = True
+    rt2.load_data(file_data=f)
+    rt2.edit_record(rec_id="Rec0001", dict_rec={"Size": 10})
+    rt2.save()
+    assert os.path.isfile(rt2._get_file_journal())
+    # the file state is read with the instance columns
+    rt.load_data(file_data=f, upsert=True, content_hash=True)
+    assert rt.data["Name"].tolist() == ["a", "b"]
+    assert rt.data["Size"].tolist() == [10, 2]
+
+
+def test_history_as_of(tmp_path, monkeypatch):
+    list_times = iter(pd.date_range("2030-01-01", periods=20, freq="h"))
+    monkeypatch.setattr(
+        RecordTable,
+        "get_datetime",
+        staticmethod(lambda: next(list_times).to_pydatetime()),
+    )
+    rt = make_record_table()
+    f = rt.export(folder_export=str(tmp_path), filename="rt")
+    rt.load_data(file_data=f, upsert=True)
+    rt.history = True
+    rt.edit_record(rec_id="Rec0001", dict_rec={"Value": 10})
+    rt.insert_record(dict_rec={"Kind": "B", "Value": 5})
+    rt.archive_record(rec_id="Rec0002")
+    rt.save()
+    rt.edit_records(records={"Rec0001": {"Value": 20}})
+    assert rt.get_record(rec_id="Rec0001", as_of="2030-01-01 03:30")["Value"] == 10
+    rt.save()
+    assert os.path.isfile(rt._get_file_history())
+    # time-travel reads from file
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2.load_data(file_data=f)
+    assert rt2.get_record(rec_id="Rec0001", as_of="2030-01-01 00:30")["Value"] == 0
+    assert rt2.get_record(rec_id="Rec0001", as_of="2030-01-01 01:30")["Value"] == 10
+    with pytest.raises(KeyError):
+        rt2.get_record(rec_id="Rec0006", as_of="2030-01-01 01:30")
+    df = rt2.data_as_of("2030-01-01 01:30")
+    assert len(df) == 5
+    assert df["RecStatus"].all()
+    assert df["RecTimestamp"].iloc[1] == pd.Timestamp("2030-01-01 00:00")
+    pd.testing.assert_frame_equal(rt2.data_as_of("2030-01-01 09:00"), rt2.data)
+    # the history file is indexed once, and later entries join their chains
+    assert list(rt2._history_index) == ["Rec0001", "Rec0006", "Rec0002"]
+    assert len(rt2._history_index["Rec0001"]) == 2
+    monkeypatch.setattr(pd, "read_csv", None)
+    rt2.history = True
+    rt2.edit_record(rec_id="Rec0001", dict_rec={"Value": 30})
+    assert rt2.get_record(rec_id="Rec0001", as_of="2030-01-01 08:30")["Value"] == 20
+
+
+def test_load_many(tmp_path):
+    list_files = []
+    for i in range(3):
+        df = pd.DataFrame({"Kind": ["A", "B"], "Value": [10 * i, 10 * i + 1]})
+        if i == 1:
+            df["RecId"] = ["Rec0100", "Rec0101"]
+        list_files.append(str(tmp_path / "raw_{}.csv".format(i)))
+        df.to_csv(list_files[-1], sep=";", index=False)
+    rt = RecordTable(name="RT", alias="RT")
+    rt.load_many(files_data=list_files, workers=2)
+    # allocated ids start above the ids carried by files
+    list_ids = ["Rec0102", "Rec0103", "Rec0100", "Rec0101", "Rec0104", "Rec0105"]
+    assert list(rt.data["RecId"]) == list_ids
+    assert list(rt.data["Value"]) == [0, 1, 10, 11, 20, 21]
+    assert rt.find(Kind="B")["Value"].tolist() == [1, 11, 21]
+    rt.insert_record(dict_rec={"Value": 7})
+    assert rt.get_record(rec_id="Rec0106")["Value"] == 7
+
+
+def test_load_many_allocation_over_explicit_ids(tmp_path):
+    list_files = []
+    for i in range(3):
+        df = pd.DataFrame({"Kind": ["A", "B"], "Value": [10 * i, 10 * i + 1]})
+        if i == 1:
+            # inside the range a sequential allocation would hand out
+            df["RecId"] = ["Rec0003", "Rec0004"]
+        list_files.append(str(tmp_path / "raw_{}.csv".format(i)))
+        df.to_csv(list_files[-1], sep=";", index=False)
+    rt = RecordTable(name="RT", alias="RT")
+    rt.load_many(files_data=list_files)
+    assert len(rt.data) == 6
+    assert rt.data["RecId"].is_unique
+    assert rt.get_record(rec_id="Rec0003")["Value"] == 10
+    assert sorted(rt.data["Value"]) == [0, 1, 10, 11, 20, 21]
+
+
+def test_lazy_load_and_unload(tmp_path):
+    rt = make_record_table()
+    f = rt.export(folder_export=str(tmp_path), filename="rt")
+    # plain exports do not write the sidecar
+    assert not os.path.isfile(rt._get_file_sidecar(file_data=f))
+    rt.file_data = f
+    rt.compact()
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2.lazy = True
+    rt2._set_lazy(file_data=f)
+    # size from the sidecar, data still on disk
+    assert rt2._data is None
+    assert rt2.size == 5
+    assert rt2.get_record(rec_id="Rec0005")["Value"] == 4
+    assert rt2._data is not None
+    # unsaved edits are not released
+    rt2.edit_record(rec_id="Rec0001", dict_rec={"Value": 10})
+    with pytest.raises(RuntimeError):
+        rt2.unload()
+    rt2.save()
+    rt2.unload()
+    assert rt2._data is None
+    assert rt2.size == 5
+    assert rt2.data["Value"].tolist() == [10, 1, 2, 3, 4]
+    # lazy load path writes the sidecar
+    os.remove(rt._get_file_sidecar(file_data=f))
+    rt3 = RecordTable(name="RT", alias="RT")
+    rt3.lazy = True
+    rt3.load_data(file_data=f)
+    rt3.unload()
+    assert rt3.size == 5
+    assert rt3._get_file_size(file_data=f) == 5
+
+
+def test_unload_counts_buffered_records(tmp_path):
+    rt = make_record_table(n=3)
+    f = rt.export(folder_export=str(tmp_path), filename="rt")
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2.journal = True
+    rt2.load_data(file_data=f)
+    rt2.insert_records(list_recs=[{"Kind": "B", "Value": 9}])
+    with pytest.raises(RuntimeError):
+        rt2.unload()
+    rt2.save()
+    rt2.unload()
+    assert list(rt2.data["RecId"]) == ["Rec0001", "Rec0002", "Rec0003", "Rec0004"]
+    rt3 = RecordTable(name="RT", alias="RT")
+    rt3.load_data(file_data=f)
+    assert rt3.get_record(rec_id="Rec0004")["Value"] == 9
+
+
+def test_load_data_on_pending_lazy_table(tmp_path):
+    rt = make_record_table()
+    f_a = rt.export(folder_export=str(tmp_path), filename="a")
+    f_b = str(tmp_path / "b.csv")
+    pd.DataFrame({"Kind": ["B", "B"], "Value": [8, 9]}).to_csv(
+        f_b, sep=";", index=False
+    )
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2._set_lazy(file_data=f_a)
+    rt2.journal = True
+    rt2.load_data(file_data=f_b)
+    assert len(rt2.data) == 7
+    # appended to the lazy data, so it is not in sync with file B
+    assert rt2.file_data == os.path.abspath(f_b)
+    assert not rt2._journal_synced
+    rt2.save()
+    rt3 = RecordTable(name="RT", alias="RT")
+    rt3.load_data(file_data=f_b)
+    assert len(rt3.data) == 7
+
+
+def test_iter_data_keeps_lazy_table_unloaded(tmp_path):
+    rt = make_record_table()
+    f = rt.export(folder_export=str(tmp_path), filename="rt")
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2._set_lazy(file_data=f)
+    df = pd.DataFrame({"Kind": ["B"] * 3, "Value": [1, 2, 3]})
+    f_raw = str(tmp_path / "raw.csv")
+    df.to_csv(f_raw, sep=";", index=False)
+    list_dfs = list(rt2.iter_data(file_data=f_raw, chunksize=2))
+    assert [len(df) for df in list_dfs] == [2, 1]
+    # ids continue after the lazy table ids
+    assert list(list_dfs[0]["RecId"]) == ["Rec0006", "Rec0007"]
+    assert list(list_dfs[1]["RecId"]) == ["Rec0008"]
+    assert rt2._data is None
+
+
+def test_lazy_size_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    rt = make_record_table()
+    f = rt.export(folder_export=str(tmp_path), filename="rt", file_format="parquet")
+    rt2 = RecordTable(name="RT", alias="RT")
+    rt2._set_lazy(file_data=f)
+    assert rt2._data is None
+    assert rt2.size == 5
+    assert len(rt2.data) == 5